@@ -1,6 +1,5 @@
 import argparse
-
-from usa.models import UnitedStates
+import sys
 
 
 def main():
@@ -17,6 +16,9 @@ def main():
 
     args = parser.parse_args()
 
+    # Imported here so --help does not pay for loading the model and numpy
+    from usa.models import UnitedStates
+
     # Initialize simulation
     us = UnitedStates.new_default(seed=args.seed)
 
@@ -25,9 +27,8 @@ def main():
 
     # Print snapshot if requested
     if args.snapshot:
-        snapshot = us.snapshot()
         print("\n=== Simulation Snapshot ===")
-        print(snapshot)
+        us.write_snapshot(sys.stdout)
 
     print("\nSimulation completed.")
 
@@ -43,24 +43,12 @@ def main():
     usa = UnitedStates.new_default(seed=42)
 
     # Run simulation for 24 months to see events and policies in action
-    for month in range(24):
-        usa.advance_turn(1)
-
-        # Display significant events
-        if usa.log and month > 0:
-            recent_log = usa.log[-3:]  # Last 3 entries
-            for entry in recent_log:
-                if any(
-                    keyword in entry.lower()
-                    for keyword in [
-                        "event",
-                        "policy",
-                        "election",
-                        "scandal",
-                        "hurricane",
-                    ]
-                ):
-                    print(f"Month {month+1}: {entry}")
+    for report in usa.advance_turn(24):
+        when = f"{report.year}-{report.month:02d}"
+        for name in report.events:
+            print(f"{when}: Event: {name}")
+        for title in report.policies:
+            print(f"{when}: Policy passed: {title}")
 
     print("\n" + "=" * 60)
     print("Simulation Summary")
@@ -5,6 +5,8 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 import random
 
+import numpy as np
+
 from usa.models import (
     Congress,
     EventManager,
@@ -32,6 +34,7 @@ usa = UnitedStates(
     opinion=None,  # Replace with actual PublicOpinion object
     event_manager=None,  # Replace with actual EventManager object
     rng=rng,
+    shock_rng=np.random.default_rng(7),  # Economic shocks, seeded separately
 )
 
 # Mock FederalBudget object
@@ -102,5 +105,5 @@ print("Simulation state loaded successfully.")
 
 # Verify loaded state by advancing a turn
 loaded_usa.advance_turn()
-for log_entry in loaded_usa.log[-3:]:
+for log_entry in loaded_usa.tail_log(3):
     print(log_entry)
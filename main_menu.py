@@ -1,18 +1,21 @@
+import functools
 import os
 import sys
 import textwrap
+import time
 import math  # Add standard math library
-from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 import pygame
 
 # Game models
 from usa.models import UnitedStates
 
 # --- Pygame setup ---
-pygame.init()
+# pygame.init(), fonts and the window are created by init_display() when a
+# screen is first built, so importing this module stays free of SDL setup.
 
 # --- Configuration Constants ---
 # Base dimensions - these are the reference dimensions for scaling
@@ -21,38 +24,74 @@ BASE_SCREEN_HEIGHT: int = 800
 SCREEN_WIDTH: int = BASE_SCREEN_WIDTH
 SCREEN_HEIGHT: int = BASE_SCREEN_HEIGHT
 FRAME_RATE: int = 60  # Pygame clock tick rate
+IDLE_WAIT_MS: int = 250  # Longest event wait when nothing needs redrawing
+RESIZE_SETTLE_S: float = 0.05  # Window size must hold this long before relayout
 
 # Scaling functions
+# Current scale factors, refreshed by update_scale() when the window size changes
+_SCALE_X: float = 1.0
+_SCALE_Y: float = 1.0
+
+def update_scale():
+    """Recompute the scale factors from SCREEN_WIDTH and SCREEN_HEIGHT"""
+    global _SCALE_X, _SCALE_Y
+    _SCALE_X = SCREEN_WIDTH / BASE_SCREEN_WIDTH
+    _SCALE_Y = SCREEN_HEIGHT / BASE_SCREEN_HEIGHT
+
 def get_scale_x():
     """Get current X scaling factor"""
-    return SCREEN_WIDTH / BASE_SCREEN_WIDTH
+    return _SCALE_X
 
 def get_scale_y():
     """Get current Y scaling factor"""  
-    return SCREEN_HEIGHT / BASE_SCREEN_HEIGHT
+    return _SCALE_Y
 
 def scale_value(value, use_x_scale=True):
     """Scale a value based on current screen size"""
-    scale = get_scale_x() if use_x_scale else get_scale_y()
-    return int(value * scale)
+    return int(value * (_SCALE_X if use_x_scale else _SCALE_Y))
 
 def scale_rect(base_rect):
     """Scale a rectangle based on current screen size"""
+    sx, sy = _SCALE_X, _SCALE_Y
     return pygame.Rect(
-        scale_value(base_rect.x, True),
-        scale_value(base_rect.y, False), 
-        scale_value(base_rect.width, True),
-        scale_value(base_rect.height, False)
+        int(base_rect.x * sx),
+        int(base_rect.y * sy),
+        int(base_rect.width * sx),
+        int(base_rect.height * sy),
     )
 
 # --- UI Constants ---
 PADDING = 20
 CORNER_RADIUS = 8
 BORDER_WIDTH = 2
+PANEL_SHADOW_BLUR = 3
 BUTTON_HEIGHT = 60
 MENU_BUTTON_WIDTH = 220
 
 
+# Rendered text by (text, color, size), cleared on theme changes. Font objects
+# themselves are cached by _get_font().
+_TEXT_CACHE: Dict[Tuple, pygame.Surface] = {}
+# Single characters by (font, color, char) for tracked labels; the font object
+# itself is the key so a freed font's id can never alias a live one
+_GLYPH_CACHE: Dict[Tuple[pygame.font.Font, Tuple, str], pygame.Surface] = {}
+
+
+def gradient_end_color(color: Tuple[int, ...], factor: float = 1.1) -> Tuple[int, int, int, int]:
+    """Return the lighter end color used for panel background gradients"""
+    return (
+        min(255, int(color[0] * factor)),
+        min(255, int(color[1] * factor)),
+        min(255, int(color[2] * factor)),
+        220 if len(color) == 4 else 255,
+    )
+
+
+def hover_tint(color: Tuple[int, ...], amount: int = 20) -> Tuple[int, ...]:
+    """Return the lighter color a button of the given color shows on hover"""
+    return tuple(min(255, c + amount) for c in color)
+
+
 # --- Theme Management ---
 class ThemeManager:
     """Manages UI theming with configurable color schemes"""
@@ -134,27 +173,46 @@ class ThemeManager:
             # Update Colors class dynamically
             theme = cls.THEMES[theme_name]
             for key, value in theme.items():
-                setattr(Colors, key, value)
+                type.__setattr__(Colors, key, value)
+            # Derived colors only change with the theme
+            Colors.PANEL_BG_GRADIENT_END = gradient_end_color(Colors.PANEL_BG)
+            for name in ("PRIMARY", "SECONDARY", "ACCENT", "SUCCESS", "WARNING"):
+                type.__setattr__(Colors, name + "_HOVER", hover_tint(getattr(Colors, name)))
+            _TEXT_CACHE.clear()
+            _GLYPH_CACHE.clear()
     
     @classmethod
     def get_color(cls, color_name):
-        """Get a color from the current theme"""
-        theme = cls.THEMES[cls.CURRENT_THEME]
-        return theme.get(color_name, (255, 255, 255))  # Default to white
+        """Get a color from the current theme.
+
+        Deprecated: read ``Colors.<NAME>`` directly, which set_theme keeps
+        current. Kept for compatibility and slated for removal.
+        """
+        return getattr(Colors, color_name, (255, 255, 255))  # Default to white
 
 
 # --- Color Palette (initialized from ThemeManager) ---
 class Colors:
-    # Colors will be dynamically populated from ThemeManager
-    pass
+    # Colors will be dynamically populated from ThemeManager as class
+    # attributes; instances are never created
+    __slots__ = ()
 
 # Initialize with default theme
 ThemeManager.set_theme("default")
 # --- Load Fonts ---
 class Fonts:
+    TITLE: Optional[pygame.font.Font] = None
+    HEADING: Optional[pygame.font.Font] = None
+    BUTTON: Optional[pygame.font.Font] = None
+    NORMAL: Optional[pygame.font.Font] = None
+    SMALL: Optional[pygame.font.Font] = None
+
     @staticmethod
     def init():
         """Initialize with fallback to system fonts if custom fonts aren't available"""
+        if Fonts.NORMAL is not None:
+            return
+        pygame.font.init()
         Fonts.TITLE = pygame.font.Font(None, 56)
         Fonts.HEADING = pygame.font.Font(None, 42)
         Fonts.BUTTON = pygame.font.Font(None, 34)
@@ -165,7 +223,101 @@ class Fonts:
         # The render method's first parameter controls anti-aliasing
 
 
-Fonts.init()
+def to_display_format(surf: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """Convert a surface that is about to be cached to the display pixel format.
+
+    Blitting a surface in a foreign format converts every pixel on every
+    blit; converting once up front avoids that. Needs the window to exist.
+    """
+    if pygame.display.get_surface() is None:
+        raise RuntimeError("call init_display() first")
+    return surf.convert_alpha() if alpha else surf.convert()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_font(name: Optional[str], size: int) -> pygame.font.Font:
+    """Return the named font (None for the default) at a size, building it once.
+
+    Building a Font parses the font file, so every size is only loaded once.
+    """
+    return pygame.font.Font(name, size)
+
+
+@functools.lru_cache(maxsize=4096)
+def _text_width(font: pygame.font.Font, text: str) -> int:
+    """Return the rendered width of text in font, measuring each string once"""
+    return font.size(text)[0]
+
+
+@functools.lru_cache(maxsize=None)
+def _linesize(font: pygame.font.Font) -> int:
+    """Return font's line spacing; it never changes for a given Font"""
+    return font.get_linesize()
+
+
+def get_sized_font(size: int) -> pygame.font.Font:
+    """Return the default font at the given size, building it only once"""
+    return _get_font(None, size)
+
+
+def render_cached_text(text: str, color: Tuple, size: int) -> pygame.Surface:
+    """Render text in the default font, reusing earlier renders"""
+    key = (text, tuple(color), size)
+    surf = _TEXT_CACHE.get(key)
+    if surf is None:
+        surf = to_display_format(get_sized_font(size).render(text, True, color))
+        _TEXT_CACHE[key] = surf
+    return surf
+
+
+def get_glyph(font: pygame.font.Font, color: Tuple, ch: str) -> pygame.Surface:
+    """Render one character, reusing earlier renders of it"""
+    key = (font, tuple(color), ch)
+    glyph = _GLYPH_CACHE.get(key)
+    if glyph is None:
+        glyph = _GLYPH_CACHE[key] = font.render(ch, True, color)
+    return glyph
+
+
+def blit_all(surface: pygame.Surface, pairs: List[Tuple]) -> None:
+    """Blit (source, position) pairs in a single call.
+
+    Uses Surface.fblits where the installed pygame provides it and falls
+    back to Surface.blits otherwise.
+    """
+    fblits = getattr(surface, "fblits", None)
+    if fblits is not None:
+        fblits(pairs)
+    else:
+        surface.blits(pairs, doreturn=False)
+
+
+# Screen regions redrawn since the last present()
+_dirty_rects: List[pygame.Rect] = []
+# Above this fraction of the window a single flip beats a list of rects
+DIRTY_AREA_LIMIT = 0.25
+
+
+def mark_dirty(rect: pygame.Rect) -> None:
+    """Queue a screen region for the next present()"""
+    _dirty_rects.append(pygame.Rect(rect))
+
+
+def present(full: bool = False) -> None:
+    """Push the frame to the window.
+
+    Only the regions queued with mark_dirty() are updated unless a full
+    redraw is requested or they cover more than DIRTY_AREA_LIMIT of the
+    window, in which case the whole display is flipped.
+    """
+    if not full:
+        area = sum(rect.width * rect.height for rect in _dirty_rects)
+        full = area > DIRTY_AREA_LIMIT * SCREEN_WIDTH * SCREEN_HEIGHT
+    if full:
+        pygame.display.flip()
+    elif _dirty_rects:
+        pygame.display.update(_dirty_rects)
+    _dirty_rects.clear()
 
 
 # --- UI Components ---
@@ -176,67 +328,148 @@ class ComponentType(Enum):
     IMAGE = auto()
 
 
-@dataclass
 class UIComponent:
     """Base class for UI components with common properties"""
 
-    rect: pygame.Rect
-    component_type: ComponentType
-    visible: bool = True
-    enabled: bool = True
-
-    # Visual properties
-    bg_color: Optional[Tuple[int, int, int]] = None
-    border_color: Optional[Tuple[int, int, int]] = None
-    border_width: int = 0
-    corner_radius: int = 0
-    alpha: int = 255  # 0-255 transparency
+    # Components are created per widget and read every frame, so they use
+    # slots; subclasses extend them with their own attributes
+    __slots__ = (
+        "rect",
+        "component_type",
+        "visible",
+        "enabled",
+        "bg_color",
+        "border_color",
+        "border_width",
+        "corner_radius",
+        "alpha",
+        "_hovered",
+        "_pressed",
+        "_dirty",
+    )
 
-    # Internal
-    _hovered: bool = False
-    _pressed: bool = False
+    def __init__(
+        self,
+        rect: pygame.Rect,
+        component_type: ComponentType,
+        visible: bool = True,
+        enabled: bool = True,
+        bg_color: Optional[Tuple[int, int, int]] = None,
+        border_color: Optional[Tuple[int, int, int]] = None,
+        border_width: int = 0,
+        corner_radius: int = 0,
+        alpha: int = 255,  # 0-255 transparency
+    ):
+        self.rect = rect
+        self.component_type = component_type
+        self.visible = visible
+        self.enabled = enabled
+
+        # Visual properties
+        self.bg_color = bg_color
+        self.border_color = border_color
+        self.border_width = border_width
+        self.corner_radius = corner_radius
+        self.alpha = alpha
+
+        # Internal
+        self._hovered = False
+        self._pressed = False
+        self._dirty = True  # looks different since it was last presented
 
     def is_hovered(self, mouse_pos: Tuple[int, int]) -> bool:
         """Check if mouse is hovering over this component"""
-        if not self.visible or not self.enabled:
-            return False
-        return self.rect.collidepoint(mouse_pos)
+        # Plain comparisons avoid a call into Rect.collidepoint; most
+        # components fail the first one or two
+        x, y = mouse_pos
+        r = self.rect
+        return (
+            self.visible
+            and self.enabled
+            and r.x <= x < r.x + r.w
+            and r.y <= y < r.y + r.h
+        )
+
+    def update(self, mouse_pos: Tuple[int, int]) -> bool:
+        """Update component state based on mouse position; return True if it changed"""
+        return update_hover((self,), mouse_pos)
 
-    def update(self, mouse_pos: Tuple[int, int]) -> None:
-        """Update component state based on mouse position"""
-        self._hovered = self.is_hovered(mouse_pos)
+    def get_blits(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Return the (surface, position) pairs that draw this component.
+
+        Screens drawing many components can collect these and hand them to
+        blit_all in one go.
+        """
+        if not self.visible:
+            return []
+        return self._background_blits(self.bg_color)
+
+    def _background_blits(
+        self, bg_color: Optional[Tuple]
+    ) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Return blits for the background in bg_color and the border"""
+        pairs = []
+        # Background with rounded corners if set
+        if bg_color:
+            pairs.append(rounded_rect_blit(self.rect, bg_color, self.corner_radius))
+        # Border with rounded corners if set
+        if self.border_color and self.border_width > 0:
+            pairs.append(
+                rounded_rect_blit(
+                    self.rect, self.border_color, self.corner_radius, self.border_width
+                )
+            )
+        return pairs
 
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the component to the given surface"""
-        if not self.visible:
+        if not self.visible or not self.rect.colliderect(surface.get_clip()):
             return
+        blit_all(surface, self.get_blits())
 
-        # Draw background with rounded corners if set
-        if self.bg_color:
-            if self.corner_radius > 0:
-                draw_rounded_rect(surface, self.rect, self.bg_color, self.corner_radius)
-            else:
-                pygame.draw.rect(surface, self.bg_color, self.rect)
 
-        # Draw border with rounded corners if set
-        if self.border_color and self.border_width > 0:
-            if self.corner_radius > 0:
-                draw_rounded_rect(
-                    surface,
-                    self.rect,
-                    self.border_color,
-                    self.corner_radius,
-                    self.border_width,
-                )
-            else:
-                pygame.draw.rect(
-                    surface, self.border_color, self.rect, self.border_width
-                )
+def update_hover(components: Iterable[UIComponent], mouse_pos: Tuple[int, int]) -> bool:
+    """Refresh the hover state of several components in one pass.
+
+    Returns True if any component's hover state changed; changed components
+    are marked dirty.
+    """
+    x, y = mouse_pos
+    changed = False
+    for component in components:
+        r = component.rect
+        hovered = (
+            component.visible
+            and component.enabled
+            and r.x <= x < r.x + r.w
+            and r.y <= y < r.y + r.h
+        )
+        if hovered != component._hovered:
+            component._hovered = hovered
+            component._dirty = True
+            changed = True
+    return changed
 
 
 class Button(UIComponent):
     """Interactive button with hover/click states"""
 
+    __slots__ = (
+        "text",
+        "on_click",
+        "hover_color",
+        "_pressed_color",
+        "text_color",
+        "disabled_color",
+        "font",
+        "icon",
+        "icon_padding",
+        "_scaled_icon",
+        "_scaled_icon_size",
+        "_state_surfs",
+        "_state_surfs_key",
+    )
+
     def __init__(
         self,
         rect: pygame.Rect,
@@ -247,7 +480,7 @@ class Button(UIComponent):
         text_color: Tuple[int, int, int] = Colors.BUTTON_TEXT,
         disabled_color: Tuple[int, int, int] = Colors.BUTTON_DISABLED,
         border_color: Tuple[int, int, int] = Colors.PANEL_BORDER,
-        font: pygame.font.Font = Fonts.BUTTON,
+        font: Optional[pygame.font.Font] = None,
         corner_radius: int = CORNER_RADIUS,
         border_width: int = BORDER_WIDTH,
         icon: Optional[pygame.Surface] = None,
@@ -266,11 +499,55 @@ class Button(UIComponent):
         self.text = text
         self.on_click = on_click
         self.hover_color = hover_color
+        # Slightly darker than hover while pressed
+        self._pressed_color = tuple(max(0, c - 20) for c in hover_color)
         self.text_color = text_color
         self.disabled_color = disabled_color
+        if font is None:
+            Fonts.init()
+            font = Fonts.BUTTON
         self.font = font
         self.icon = icon
         self.icon_padding = 10 if icon else 0
+        # Icon scaled to the current button size, rebuilt only on resize
+        self._scaled_icon: Optional[pygame.Surface] = None
+        self._scaled_icon_size: Optional[Tuple[int, int]] = None
+        # Whole button pre-rendered per background color (normal, hover,
+        # pressed, disabled); dropped when anything else it shows changes
+        self._state_surfs: Dict[Tuple, pygame.Surface] = {}
+        self._state_surfs_key: Optional[Tuple] = None
+
+    def update_text(self, new_text: str) -> None:
+        """Change the button label.
+
+        The pre-rendered state surfaces are keyed on the text, so they are
+        rebuilt on the next draw; the button is only marked dirty when the
+        text actually differs.
+        """
+        if new_text != self.text:
+            self.text = new_text
+            self._dirty = True
+
+    def _get_text_surface(self) -> pygame.Surface:
+        """Return the rendered label from the shared text cache"""
+        # Scale font size based on button size
+        scaled_font_size = max(12, min(self.rect.height // 2, scale_value(24)))
+        return render_cached_text(self.text, self.text_color, scaled_font_size)
+
+    def _get_scaled_icon(self) -> pygame.Surface:
+        """Return the icon scaled to the button, rescaling only when the size changes"""
+        target = (self.rect.width, self.rect.height)
+        if target != self._scaled_icon_size:
+            icon_scale = min(self.rect.height * 0.6, self.rect.width * 0.3) / max(self.icon.get_width(), self.icon.get_height())
+            if icon_scale != 1.0:
+                icon_size = (int(self.icon.get_width() * icon_scale), int(self.icon.get_height() * icon_scale))
+                self._scaled_icon = to_display_format(
+                    pygame.transform.smoothscale(self.icon, icon_size)
+                )
+            else:
+                self._scaled_icon = self.icon
+            self._scaled_icon_size = target
+        return self._scaled_icon
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse events and return True if clicked"""
@@ -280,11 +557,13 @@ class Button(UIComponent):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self._hovered:
                 self._pressed = True
+                self._dirty = True
                 return False
 
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             was_pressed = self._pressed
             self._pressed = False
+            self._dirty = self._dirty or was_pressed
 
             if was_pressed and self._hovered and self.on_click:
                 self.on_click()
@@ -292,65 +571,118 @@ class Button(UIComponent):
 
         return False
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw button with hover/press effects"""
+    def get_blits(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Return the blits for the button in its current hover/press state"""
         if not self.visible:
-            return
+            return []
 
         # Determine background color based on state
         if not self.enabled:
             bg = self.disabled_color
         elif self._pressed and self._hovered:
-            # Slightly darker when pressed
-            bg = tuple(max(0, c - 20) for c in self.hover_color)
+            bg = self._pressed_color
         elif self._hovered:
             bg = self.hover_color
         else:
             bg = self.bg_color
 
-        # Store original and set current background for parent draw
-        original_bg = self.bg_color
-        self.bg_color = bg
+        return [(self._state_surface(bg), self.rect.topleft)]
 
-        # Draw button background and border
-        super().draw(surface)
+    def _state_surface(self, bg: Tuple) -> pygame.Surface:
+        """Return the button pre-rendered with background bg"""
+        key = (
+            self.rect.size,
+            self.text,
+            self.text_color,
+            self.border_color,
+            self.border_width,
+            self.corner_radius,
+            self.icon,
+            self.icon_padding,
+            _SCALE_X,
+            _SCALE_Y,
+        )
+        if key != self._state_surfs_key:
+            self._state_surfs = {}
+            self._state_surfs_key = key
+        surf = self._state_surfs.get(bg)
+        if surf is None:
+            surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            x, y = self.rect.topleft
+            blit_all(
+                surf,
+                [(part, (px - x, py - y)) for part, (px, py) in self._render_blits(bg)],
+            )
+            surf = to_display_format(surf)
+            self._state_surfs[bg] = surf
+        return surf
 
-        # Restore original background
-        self.bg_color = original_bg
+    def _render_blits(self, bg: Tuple) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Return the separate background, border, icon and text blits"""
+        # Button background and border
+        pairs = self._background_blits(bg)
 
-        # Scale font size based on button size
-        scaled_font_size = max(12, min(self.rect.height // 2, scale_value(24)))
-        scaled_font = pygame.font.Font(None, scaled_font_size)
-        
         # Render text centered on button with scaled font
-        text_surf = scaled_font.render(self.text, True, self.text_color)
+        text_surf = self._get_text_surface()
 
         # Account for icon if present
         icon_offset = 0
         if self.icon:
-            icon_scale = min(self.rect.height * 0.6, self.rect.width * 0.3) / max(self.icon.get_width(), self.icon.get_height())
-            if icon_scale != 1.0:
-                icon_size = (int(self.icon.get_width() * icon_scale), int(self.icon.get_height() * icon_scale))
-                scaled_icon = pygame.transform.scale(self.icon, icon_size)
-            else:
-                scaled_icon = self.icon
-                
+            scaled_icon = self._get_scaled_icon()
             icon_offset = (scaled_icon.get_width() + scale_value(self.icon_padding)) // 2
             icon_rect = scaled_icon.get_rect(
                 centery=self.rect.centery, right=self.rect.centerx - 5
             )
-            surface.blit(scaled_icon, icon_rect)
+            pairs.append((scaled_icon, icon_rect.topleft))
 
         # Position text
         text_rect = text_surf.get_rect(
             center=(self.rect.centerx + icon_offset, self.rect.centery)
         )
-        surface.blit(text_surf, text_rect)
+        pairs.append((text_surf, text_rect.topleft))
+        return pairs
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw button with hover/press effects"""
+        if not self.visible or not self.rect.colliderect(surface.get_clip()):
+            return
+        blit_all(surface, self.get_blits())
+
+        # Under a partial clip the rest of the button still shows its old
+        # state, so it stays dirty until drawn whole
+        if self._dirty and surface.get_clip().contains(
+            self.rect.clip(surface.get_rect())
+        ):
+            mark_dirty(self.rect)
+            self._dirty = False
 
 
 class Panel(UIComponent):
     """Container panel with optional title and border"""
 
+    __slots__ = (
+        "title",
+        "title_color",
+        "title_font",
+        "title_height",
+        "_title_key",
+        "_title_surf",
+        "_chrome_key_cached",
+        "_chrome_surf",
+        "_chrome_margin",
+        "draggable",
+        "resizable",
+        "shadow_offset",
+        "_dragging",
+        "_drag_offset_x",
+        "_drag_offset_y",
+        "_resizing",
+        "_resize_edge",
+        "_min_width",
+        "_min_height",
+        "content_rect",
+    )
+
     def __init__(
         self,
         rect: pygame.Rect,
@@ -360,7 +692,7 @@ class Panel(UIComponent):
         title_color: Tuple[int, int, int] = Colors.TEXT_DARK,
         corner_radius: int = CORNER_RADIUS,
         border_width: int = BORDER_WIDTH,
-        title_font: pygame.font.Font = Fonts.HEADING,
+        title_font: Optional[pygame.font.Font] = None,
         draggable: bool = True,
         resizable: bool = True,
         shadow_offset: int = 3,
@@ -375,8 +707,18 @@ class Panel(UIComponent):
         )
         self.title = title
         self.title_color = title_color
+        if title_font is None:
+            Fonts.init()
+            title_font = Fonts.HEADING
         self.title_font = title_font
         self.title_height = title_font.get_height() + PADDING if title else 0
+        # Rendered title, rebuilt only when title text, color or font changes
+        self._title_key: Optional[Tuple] = None
+        self._title_surf: Optional[pygame.Surface] = None
+        # Pre-rendered chrome, rebuilt only when _chrome_key() changes
+        self._chrome_key_cached: Optional[Tuple] = None
+        self._chrome_surf: Optional[pygame.Surface] = None
+        self._chrome_margin = 0
         self.draggable = draggable
         self.resizable = resizable
         self.shadow_offset = shadow_offset
@@ -400,6 +742,16 @@ class Panel(UIComponent):
             self.rect.height - (PADDING * 2) - self.title_height,
         )
 
+    def _get_title_surface(self) -> pygame.Surface:
+        """Return the rendered title, re-rendering only when its inputs change"""
+        key = (self.title, tuple(self.title_color), self.title_font)
+        if key != self._title_key:
+            self._title_surf = to_display_format(
+                self.title_font.render(self.title, True, self.title_color)
+            )
+            self._title_key = key
+        return self._title_surf
+
     def _update_content_rect(self):
         """Update the content rectangle calculation after moving or resizing"""
         self.content_rect = pygame.Rect(
@@ -474,46 +826,99 @@ class Panel(UIComponent):
             
         return False
     
+    def _chrome_key(self) -> Tuple:
+        """Everything the cached panel chrome depends on"""
+        return (
+            self.rect.size,
+            ThemeManager.CURRENT_THEME,
+            self.title,
+            tuple(self.bg_color),
+            None if self.border_color is None else tuple(self.border_color),
+            tuple(self.title_color),
+            self.title_font,
+            self.border_width,
+            self.corner_radius,
+            self.shadow_offset,
+            self.resizable,
+        )
+
     def draw(self, surface: pygame.Surface) -> None:
         """Draw panel with optional title, shadow, and gradient effects"""
-        if not self.visible:
+        if not self.visible or not self.rect.colliderect(surface.get_clip()):
             return
+        surface.blit(*self.chrome_blit())
+        self.draw_overlay(surface)
+
+    def draw_overlay(self, surface: pygame.Surface) -> None:
+        """Draw the per-frame parts that sit on top of the cached chrome"""
+
+    def chrome_blit(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Return the (surface, position) pair for the panel chrome.
+
+        The chrome only changes with size, theme or styling, so it is rendered
+        once into an off-screen surface; callers drawing several panels can
+        pass the pairs to blit_all together.
+        """
+        key = self._chrome_key()
+        if key != self._chrome_key_cached:
+            area = self.chrome_rect()
+            margin = self.rect.x - area.x
+            chrome = pygame.Surface(area.size, pygame.SRCALPHA)
+            self._draw_chrome(
+                chrome, pygame.Rect(margin, margin, self.rect.width, self.rect.height)
+            )
+            self._chrome_surf = to_display_format(chrome)
+            self._chrome_margin = margin
+            self._chrome_key_cached = key
+        return (
+            self._chrome_surf,
+            (self.rect.x - self._chrome_margin, self.rect.y - self._chrome_margin),
+        )
 
+    def chrome_rect(self) -> pygame.Rect:
+        """Return the area the chrome covers, drop shadow included"""
+        margin = PANEL_SHADOW_BLUR if self.shadow_offset > 0 else 0
+        return pygame.Rect(
+            self.rect.x - margin,
+            self.rect.y - margin,
+            self.rect.width + margin * 2 + self.shadow_offset,
+            self.rect.height + margin * 2 + self.shadow_offset,
+        )
+
+    def _draw_chrome(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        """Draw shadow, background, border, title bar and resize handle at rect"""
         # Draw shadow if specified
         if self.shadow_offset > 0:
             draw_shadow(
                 surface,
-                self.rect,
+                rect,
                 self.corner_radius,
                 shadow_offset=self.shadow_offset,
                 shadow_color=Colors.PANEL_SHADOW,
-                blur_radius=3
+                blur_radius=PANEL_SHADOW_BLUR
             )
                 
-        # Draw panel background with gradient effect
-        gradient_end_color = (
-            min(255, int(self.bg_color[0] * 1.1)),
-            min(255, int(self.bg_color[1] * 1.1)),
-            min(255, int(self.bg_color[2] * 1.1)),
-            220 if len(self.bg_color) == 4 else 255
-        )
-        
-        # Draw panel background with gradient
+        # Draw panel background with gradient; the theme's panel color has
+        # its end color precomputed by ThemeManager.set_theme
+        if self.bg_color == Colors.PANEL_BG:
+            end_color = Colors.PANEL_BG_GRADIENT_END
+        else:
+            end_color = gradient_end_color(self.bg_color)
         draw_rounded_rect(
             surface,
-            self.rect,
+            rect,
             self.bg_color,
             self.corner_radius,
             gradient=True,
             gradient_direction="vertical",
-            gradient_end_color=gradient_end_color
+            gradient_end_color=end_color
         )
         
         # Draw border if specified and border_color provided
         if self.border_width > 0 and self.border_color is not None:
             draw_rounded_rect(
                 surface,
-                self.rect,
+                rect,
                 self.border_color,
                 self.corner_radius,
                 border_width=self.border_width
@@ -523,81 +928,24 @@ class Panel(UIComponent):
         if self.title:
             # Draw title background (light gradient)
             title_bg_rect = pygame.Rect(
-                self.rect.x + BORDER_WIDTH, 
-                self.rect.y + BORDER_WIDTH,
-                self.rect.width - BORDER_WIDTH * 2, 
+                rect.x + BORDER_WIDTH, 
+                rect.y + BORDER_WIDTH,
+                rect.width - BORDER_WIDTH * 2, 
                 self.title_height
             )
             
             # Create a sub-rectangle for the title area with rounded top corners
             title_corner_radius = self.corner_radius if self.corner_radius > 0 else 0
             
-            # Draw title area with subtle gradient
             title_bg_color = Colors.PANEL_HEADER
-            title_gradient_end = (
-                min(255, int(title_bg_color[0] * 1.05)),
-                min(255, int(title_bg_color[1] * 1.05)),
-                min(255, int(title_bg_color[2] * 1.05)),
-                255
-            )
-            
-            # Special title background with top corners only rounded
-            if title_corner_radius > 0:
-                # Top part with rounded corners
-                pygame.draw.rect(
-                    surface,
-                    title_bg_color,
-                    pygame.Rect(
-                        title_bg_rect.left + title_corner_radius,
-                        title_bg_rect.top,
-                        title_bg_rect.width - (2 * title_corner_radius),
-                        title_bg_rect.height
-                    )
-                )
-                
-                # Left and right sides
-                pygame.draw.rect(
-                    surface,
-                    title_bg_color,
-                    pygame.Rect(
-                        title_bg_rect.left,
-                        title_bg_rect.top + title_corner_radius,
-                        title_corner_radius,
-                        title_bg_rect.height - title_corner_radius
-                    )
-                )
-                pygame.draw.rect(
-                    surface,
-                    title_bg_color,
-                    pygame.Rect(
-                        title_bg_rect.right - title_corner_radius,
-                        title_bg_rect.top + title_corner_radius,
-                        title_corner_radius,
-                        title_bg_rect.height - title_corner_radius
-                    )
-                )
-                
-                # Top corners
-                pygame.draw.circle(
-                    surface,
-                    title_bg_color,
-                    (title_bg_rect.left + title_corner_radius, title_bg_rect.top + title_corner_radius),
-                    title_corner_radius
-                )
-                pygame.draw.circle(
-                    surface,
-                    title_bg_color,
-                    (title_bg_rect.right - title_corner_radius, title_bg_rect.top + title_corner_radius),
-                    title_corner_radius
-                )
-            else:
-                # Simple rectangle if no rounded corners
-                pygame.draw.rect(surface, title_bg_color, title_bg_rect)
-            
-            # Render title text
-            title_surf = self.title_font.render(self.title, True, self.title_color)
+
+            # Title background with only the top corners rounded
+            draw_rounded_top_rect(surface, title_bg_rect, title_bg_color, title_corner_radius)
+
+            # Title text is static, so reuse the cached render
+            title_surf = self._get_title_surface()
             title_rect = title_surf.get_rect(
-                x=self.rect.x + PADDING, y=self.rect.y + PADDING // 2
+                x=rect.x + PADDING, y=rect.y + PADDING // 2
             )
             surface.blit(title_surf, title_rect)
 
@@ -605,32 +953,11 @@ class Panel(UIComponent):
             pygame.draw.line(
                 surface,
                 self.border_color,
-                (self.rect.x + PADDING, self.rect.y + self.title_height),
-                (self.rect.right - PADDING, self.rect.y + self.title_height),
+                (rect.x + PADDING, rect.y + self.title_height),
+                (rect.right - PADDING, rect.y + self.title_height),
                 1,
             )
             
-        # Draw resize handle if panel is resizable
-        if self.resizable and not self._resizing:
-            handle_size = 8
-            handle_color = Colors.RESIZE_HANDLE
-            
-            # Bottom right corner resize handle
-            pygame.draw.line(
-                surface,
-                handle_color,
-                (self.rect.right - handle_size, self.rect.bottom - 2),
-                (self.rect.right - 2, self.rect.bottom - 2),
-                2
-            )
-            pygame.draw.line(
-                surface,
-                handle_color,
-                (self.rect.right - 2, self.rect.bottom - handle_size),
-                (self.rect.right - 2, self.rect.bottom - 2),
-                2
-            )
-            
         # Draw resize handle if resizable
         if self.resizable:
             handle_size = 10
@@ -642,8 +969,8 @@ class Panel(UIComponent):
                 pygame.draw.line(
                     surface,
                     handle_color,
-                    (self.rect.right - handle_size + offset, self.rect.bottom - 3),
-                    (self.rect.right - 3, self.rect.bottom - handle_size + offset),
+                    (rect.right - handle_size + offset, rect.bottom - 3),
+                    (rect.right - 3, rect.bottom - handle_size + offset),
                     2
                 )
 
@@ -654,6 +981,30 @@ class ScrollPanel(Panel):
     Supports smooth wheel scrolling and dragging the scrollbar thumb.
     """
 
+    __slots__ = (
+        "scroll_y",
+        "content_height",
+        "scrollbar_width",
+        "scroll_active",
+        "target_scroll",
+        "smooth_rate",
+        "_last_scroll_t",
+        "_scrollbar_dragging",
+        "_drag_offset",
+        "_content_dragging",
+        "_content_drag_start",
+        "_content_drag_start_scroll",
+        "_handlers",
+        "_scrollbar_hover",
+        "_scrollbar_fade",
+        "_geom_valid",
+        "_needs_scrollbar",
+        "_track_rect_cache",
+        "_thumb_rect_cache",
+        "_thumb_surfs",
+        "_thumb_surfs_key",
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.scroll_y = 0.0
@@ -663,20 +1014,52 @@ class ScrollPanel(Panel):
 
         # smooth scrolling target and drag state
         self.target_scroll = 0.0
-        self.smooth_factor = 0.18  # interpolation factor (0..1)
+        self.smooth_rate = 12.0  # exponential approach rate, per second
+        self._last_scroll_t = time.perf_counter()
         self._scrollbar_dragging = False
         self._drag_offset = 0
+        self._content_dragging = False
+        self._content_drag_start = 0
+        self._content_drag_start_scroll = 0.0
+
+        # Event handlers by event type
+        self._handlers = {
+            pygame.MOUSEWHEEL: self._on_wheel,
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_down,
+            pygame.MOUSEBUTTONUP: self._on_mouse_up,
+            pygame.MOUSEMOTION: self._on_motion,
+        }
         
         # Animation properties
         self._scrollbar_hover = False
         self._scrollbar_fade = 0.0  # 0.0 to 1.0 for opacity
 
+        # Scrollbar track and thumb rects, updated in place after
+        # _invalidate_scroll_cache() instead of reallocated
+        self._geom_valid = False
+        self._needs_scrollbar = False
+        self._track_rect_cache = pygame.Rect(0, 0, 0, 0)
+        self._thumb_rect_cache = pygame.Rect(0, 0, 0, 0)
+        # Thumb surfaces by "active" (hovered or dragged) state, rebuilt when
+        # the thumb size or theme changes; the fade is applied with set_alpha
+        self._thumb_surfs: Dict[bool, pygame.Surface] = {}
+        self._thumb_surfs_key: Optional[Tuple] = None
+
     def set_content_height(self, h: int) -> None:
         self.content_height = h
         # clamp scroll and target to valid range
         max_scroll = max(0, self.content_height - self.content_rect.height)
         self.scroll_y = max(0.0, min(self.scroll_y, float(max_scroll)))
         self.target_scroll = max(0.0, min(self.target_scroll, float(max_scroll)))
+        self._invalidate_scroll_cache()
+
+    def _update_content_rect(self):
+        super()._update_content_rect()
+        self._invalidate_scroll_cache()
+
+    def _invalidate_scroll_cache(self) -> None:
+        """Drop the scrollbar geometry after scroll, content or layout changes"""
+        self._geom_valid = False
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle scrolling events and return True if event was handled"""
@@ -684,116 +1067,120 @@ class ScrollPanel(Panel):
         parent_handled = super().handle_event(event)
         if parent_handled:
             return True
-            
-        # Handle scrolling
-        if event.type == pygame.MOUSEWHEEL:
-            # Only scroll if mouse is over panel
-            if self.rect.collidepoint(pygame.mouse.get_pos()):
-                max_scroll = max(0, self.content_height - self.content_rect.height)
-                # larger delta for more responsive scroll
-                self.target_scroll = max(
-                    0.0, min(float(max_scroll), self.target_scroll - event.y * 60.0)
-                )
-                return True
 
-        # Mouse button for dragging the thumb
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mx, my = pygame.mouse.get_pos()
-            thumb = self._thumb_rect()
-            if thumb and thumb.collidepoint((mx, my)):
-                self._scrollbar_dragging = True
-                self._drag_offset = my - thumb.y
-                return True
-                
-            # Also handle click on scrollbar track (not just thumb)
-            scrollbar_rect = self._scrollbar_track_rect()
-            if scrollbar_rect and scrollbar_rect.collidepoint((mx, my)):
-                # Jump to clicked position
-                view_h = self.content_rect.height
-                max_scroll = max(0, self.content_height - view_h)
-                thumb = self._thumb_rect()
-                if thumb:
-                    thumb_h = thumb.height
-                    # Calculate position relative to the track
-                    rel_y = my - self.content_rect.y
-                    rel_y = max(0, min(rel_y, view_h))
-                    proportion = rel_y / max(1, view_h)
-                    self.target_scroll = int(proportion * max_scroll)
-                return True
+        handler = self._handlers.get(event.type)
+        return handler(event) if handler else False
 
-        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            was_dragging = self._scrollbar_dragging
-            self._scrollbar_dragging = False
-            return was_dragging
+    def _on_wheel(self, event: pygame.event.Event) -> bool:
+        # Only scroll if mouse is over panel; wheel events carry no position
+        if self.rect.collidepoint(pygame.mouse.get_pos()):
+            max_scroll = max(0, self.content_height - self.content_rect.height)
+            # larger delta for more responsive scroll
+            self.target_scroll = max(
+                0.0, min(float(max_scroll), self.target_scroll - event.y * 60.0)
+            )
+            return True
+        return False
 
-        elif event.type == pygame.MOUSEMOTION:
-            # Handle thumb dragging
-            if self._scrollbar_dragging:
-                # Map mouse y to scroll position
-                _, my = pygame.mouse.get_pos()
-                view_h = self.content_rect.height
-                max_scroll = max(0, self.content_height - view_h)
-                thumb = self._thumb_rect()
-                if not thumb:
-                    return False
-                thumb_h = thumb.height
-                # Compute top of thumb relative to content_rect
-                rel_y = my - self.content_rect.y - self._drag_offset
-                rel_y = max(0, min(rel_y, view_h - thumb_h))
-                proportion = rel_y / max(1, (view_h - thumb_h))
+    def _on_mouse_down(self, event: pygame.event.Event) -> bool:
+        if event.button != 1:
+            return False
+        mx, my = event.pos
+
+        # Dragging the thumb
+        thumb = self._thumb_rect()
+        if thumb and thumb.collidepoint((mx, my)):
+            self._scrollbar_dragging = True
+            self._drag_offset = my - thumb.y
+            return True
+
+        # Click on scrollbar track (not just thumb) jumps to that position
+        scrollbar_rect = self._scrollbar_track_rect()
+        if scrollbar_rect and scrollbar_rect.collidepoint((mx, my)):
+            view_h = self.content_rect.height
+            max_scroll = max(0, self.content_height - view_h)
+            if thumb:
+                # Calculate position relative to the track
+                rel_y = my - self.content_rect.y
+                rel_y = max(0, min(rel_y, view_h))
+                proportion = rel_y / max(1, view_h)
                 self.target_scroll = int(proportion * max_scroll)
-                return True
-                
-            # Check for scrollbar hover
-            mx, my = pygame.mouse.get_pos()
-            scrollbar_rect = self._scrollbar_track_rect()
-            self._scrollbar_hover = scrollbar_rect and scrollbar_rect.collidepoint((mx, my))
-        
-        # Handle scroll via touch (drag within content area)
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.content_rect.collidepoint(pygame.mouse.get_pos()):
-                # Start content dragging (different from scrollbar dragging)
-                self._content_dragging = True
-                self._content_drag_start = pygame.mouse.get_pos()[1]
-                self._content_drag_start_scroll = self.target_scroll
-                return True
-                
-        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            was_content_dragging = getattr(self, '_content_dragging', False)
-            self._content_dragging = False
-            return was_content_dragging
-            
-        elif event.type == pygame.MOUSEMOTION and getattr(self, '_content_dragging', False):
+            return True
+
+        # Scroll via touch (drag within content area)
+        if self.content_rect.collidepoint((mx, my)):
+            self._content_dragging = True
+            self._content_drag_start = my
+            self._content_drag_start_scroll = self.target_scroll
+            return True
+
+        return False
+
+    def _on_mouse_up(self, event: pygame.event.Event) -> bool:
+        if event.button != 1:
+            return False
+        was_dragging = self._scrollbar_dragging or self._content_dragging
+        self._scrollbar_dragging = False
+        self._content_dragging = False
+        return was_dragging
+
+    def _on_motion(self, event: pygame.event.Event) -> bool:
+        # Handle thumb dragging
+        if self._scrollbar_dragging:
+            # Map mouse y to scroll position
+            my = event.pos[1]
+            view_h = self.content_rect.height
+            max_scroll = max(0, self.content_height - view_h)
+            thumb = self._thumb_rect()
+            if not thumb:
+                return False
+            thumb_h = thumb.height
+            # Compute top of thumb relative to content_rect
+            rel_y = my - self.content_rect.y - self._drag_offset
+            rel_y = max(0, min(rel_y, view_h - thumb_h))
+            proportion = rel_y / max(1, (view_h - thumb_h))
+            self.target_scroll = int(proportion * max_scroll)
+            return True
+
+        if self._content_dragging:
             # Drag content in the direction of mouse movement
-            current_y = pygame.mouse.get_pos()[1]
-            drag_delta = self._content_drag_start - current_y
-            
+            drag_delta = self._content_drag_start - event.pos[1]
             max_scroll = max(0, self.content_height - self.content_rect.height)
             self.target_scroll = max(
                 0.0, min(float(max_scroll), self._content_drag_start_scroll + drag_delta)
             )
             return True
-            
+
+        # Check for scrollbar hover
+        scrollbar_rect = self._scrollbar_track_rect()
+        self._scrollbar_hover = bool(
+            scrollbar_rect and scrollbar_rect.collidepoint(event.pos)
+        )
         return False
-        
+
     def handle_scroll(self, delta: int) -> None:
         """Directly scroll by a delta amount"""
         max_scroll = max(0, self.content_height - self.content_rect.height)
         self.target_scroll = max(0.0, min(float(max_scroll), self.target_scroll + delta))
 
-    def draw(self, surface: pygame.Surface) -> None:
-        # Draw the panel frame
-        super().draw(surface)
-
+    def draw_overlay(self, surface: pygame.Surface) -> None:
         # Clip content drawing to the content_rect
         prev_clip = surface.get_clip()
-        surface.set_clip(self.content_rect)
-
-        # Smoothly approach target_scroll
+        surface.set_clip(self.content_rect.clip(prev_clip))
+
+        # Smoothly approach target_scroll at the same speed whatever the
+        # frame rate; the step is capped so the first frame after an idle
+        # wait does not jump most of the way
+        now = time.perf_counter()
+        dt = min(now - self._last_scroll_t, 0.05)
+        self._last_scroll_t = now
         if abs(self.target_scroll - self.scroll_y) > 0.5:
-            self.scroll_y += (self.target_scroll - self.scroll_y) * self.smooth_factor
-        else:
+            alpha = 1.0 - math.exp(-self.smooth_rate * dt)
+            self.scroll_y += (self.target_scroll - self.scroll_y) * alpha
+            self._invalidate_scroll_cache()
+        elif self.scroll_y != self.target_scroll:
             self.scroll_y = float(self.target_scroll)
+            self._invalidate_scroll_cache()
 
         # draw a scrollbar if needed
         if self.content_height > self.content_rect.height:
@@ -801,23 +1188,44 @@ class ScrollPanel(Panel):
             if self._scrollbar_hover or self._scrollbar_dragging:
                 self._scrollbar_fade = min(1.0, self._scrollbar_fade + 0.15)
             else:
-                self._scrollbar_fade = max(0.2, self._scrollbar_fade - 0.05)  # Fade to partly transparent
-                
-            self._draw_scrollbar(surface)
+                self._scrollbar_fade = max(0.0, self._scrollbar_fade - 0.05)  # Fade out when idle
+
+            if self._scrollbar_fade > 0.0:
+                self._draw_scrollbar(surface)
 
         surface.set_clip(prev_clip)
 
-    def _scrollbar_track_rect(self) -> Optional[pygame.Rect]:
-        """Return the scrollbar track rectangle"""
+    def is_animating(self) -> bool:
+        """Return True while the scroll position or scrollbar fade is still moving"""
+        if self.scroll_y != self.target_scroll:
+            return True
         if self.content_height <= self.content_rect.height:
-            return None
-            
-        return pygame.Rect(
-            self.content_rect.right - self.scrollbar_width - 6,
-            self.content_rect.y,
-            self.scrollbar_width,
-            self.content_rect.height
+            return False
+        rest = 1.0 if (self._scrollbar_hover or self._scrollbar_dragging) else 0.0
+        return self._scrollbar_fade != rest
+
+    def _update_scrollbar_geometry(self) -> None:
+        """Refresh the track and thumb rects, only after an invalidation"""
+        if self._geom_valid:
+            return
+        self._geom_valid = True
+        self._needs_scrollbar = self.content_height > self.content_rect.height
+        if not self._needs_scrollbar:
+            return
+        x = self.content_rect.right - self.scrollbar_width - 6
+        view_h = self.content_rect.height
+        self._track_rect_cache.update(x, self.content_rect.y, self.scrollbar_width, view_h)
+        thumb_h = max(30, int(view_h * (view_h / self.content_height)))
+        max_scroll = self.content_height - view_h
+        thumb_y = int(
+            self.content_rect.y + (self.scroll_y / max_scroll) * (view_h - thumb_h)
         )
+        self._thumb_rect_cache.update(x, thumb_y, self.scrollbar_width, thumb_h)
+
+    def _scrollbar_track_rect(self) -> Optional[pygame.Rect]:
+        """Return the scrollbar track rectangle"""
+        self._update_scrollbar_geometry()
+        return self._track_rect_cache if self._needs_scrollbar else None
 
     def _draw_scrollbar(self, surface: pygame.Surface) -> None:
         # draw scrollbar track
@@ -826,8 +1234,12 @@ class ScrollPanel(Panel):
             return
             
         # Draw track with rounded corners
-        track_color = Colors.SCROLLBAR_BG
-        pygame.draw.rect(surface, track_color, track_rect, border_radius=4)
+        surface.blit(
+            _rounded_rect_surface(
+                track_rect.width, track_rect.height, 4, tuple(Colors.SCROLLBAR_BG), 0
+            ),
+            track_rect.topleft,
+        )
         
         # Get thumb rect
         thumb_rect = self._thumb_rect()
@@ -835,41 +1247,29 @@ class ScrollPanel(Panel):
             return
             
         # Draw thumb with hover/active effects
-        thumb_color = Colors.SCROLLBAR_THUMB
-        if self._scrollbar_dragging:
-            thumb_color = Colors.SCROLLBAR_THUMB_HOVER
-        elif self._scrollbar_hover:
-            thumb_color = Colors.SCROLLBAR_THUMB_HOVER
-            
+        key = (thumb_rect.size, ThemeManager.CURRENT_THEME)
+        if key != self._thumb_surfs_key:
+            # Copies, so set_alpha doesn't touch the shared shape cache
+            self._thumb_surfs = {
+                active: _rounded_rect_surface(
+                    thumb_rect.width, thumb_rect.height, 4, (*color[:3], 255), 0
+                ).copy()
+                for active, color in (
+                    (False, Colors.SCROLLBAR_THUMB),
+                    (True, Colors.SCROLLBAR_THUMB_HOVER),
+                )
+            }
+            self._thumb_surfs_key = key
+        thumb = self._thumb_surfs[self._scrollbar_dragging or bool(self._scrollbar_hover)]
+
         # Apply fade opacity
-        alpha = int(200 + 55 * self._scrollbar_fade)  # 200-255 range
-        if len(thumb_color) == 3:
-            thumb_color = (thumb_color[0], thumb_color[1], thumb_color[2], alpha)
-        else:
-            thumb_color = (thumb_color[0], thumb_color[1], thumb_color[2], alpha)
-            
-        # Draw thumb with rounded corners
-        pygame.draw.rect(surface, thumb_color, thumb_rect, border_radius=4)
+        thumb.set_alpha(int(255 * self._scrollbar_fade))
+        surface.blit(thumb, thumb_rect.topleft)
 
     def _thumb_rect(self) -> Optional[pygame.Rect]:
         """Return the current scrollbar thumb rect (or None if not needed)"""
-        if self.content_height <= self.content_rect.height:
-            return None
-        view_h = self.content_rect.height
-        thumb_h = max(30, int(view_h * (view_h / self.content_height)))
-        max_scroll = self.content_height - view_h
-        if max_scroll <= 0:
-            thumb_y = self.content_rect.y
-        else:
-            thumb_y = int(
-                self.content_rect.y + (self.scroll_y / max_scroll) * (view_h - thumb_h)
-            )
-        return pygame.Rect(
-            self.content_rect.right - self.scrollbar_width - 6,
-            thumb_y,
-            self.scrollbar_width,
-            thumb_h,
-        )
+        self._update_scrollbar_geometry()
+        return self._thumb_rect_cache if self._needs_scrollbar else None
 
 
 class Label:
@@ -880,7 +1280,7 @@ class Label:
         text: str,
         x: int,
         y: int,
-        font: pygame.font.Font = Fonts.NORMAL,
+        font: Optional[pygame.font.Font] = None,
         color: Tuple[int, int, int] = Colors.TEXT_DARK,
         max_width: Optional[int] = None,
         align: str = "left",
@@ -891,6 +1291,9 @@ class Label:
         self.text = text
         self.x = x
         self.y = y
+        if font is None:
+            Fonts.init()
+            font = Fonts.NORMAL
         self.font = font
         self.color = color
         self.max_width = max_width
@@ -898,36 +1301,48 @@ class Label:
         self.padding = padding
         self.line_spacing = line_spacing
         self.tracking = tracking
-        self._rendered_lines = []
+        # All lines composited into one surface, drawn with a single blit
+        self._composite: Optional[pygame.Surface] = None
+        self._composite_pos: Tuple[int, int] = (x, y)
         self._height = 0
         self._width = 0
+        # Inputs of the last render; see _render_key
+        self._rendered_key: Optional[Tuple] = None
         self._render_text()
 
+    def _render_key(self, text: str) -> Tuple:
+        """Everything the pre-rendered surface depends on, for the given text"""
+        return (
+            text,
+            self.font,
+            tuple(self.color),
+            self.max_width,
+            self.align,
+            self.line_spacing,
+            self.tracking,
+            self.x,
+            self.y,
+        )
+
     def _render_text(self) -> None:
-        """Pre-render wrapped text lines"""
-        self._rendered_lines = []
+        """Pre-render wrapped text lines into a single surface"""
+        self._rendered_key = self._render_key(self.text)
+        self._composite = None
         self._height = 0
         self._width = 0
 
         if not self.text:
             return
 
-        # If max width is set, wrap text using font-aware measurement
-        if self.max_width:
-            wrapped_lines = []
-            for line in self.text.splitlines():
-                if not line:
-                    wrapped_lines.append("")
-                    continue
-                # Use the helper which measures words with the font for accurate wrapping
-                wrapped_lines.extend(wrap_text(line, self.font, self.max_width))
-        else:
-            # No wrapping, just split on newlines
-            wrapped_lines = self.text.splitlines()
+        wrapped_lines = split_text_lines(self.text, self.font, self.max_width)
 
         # Render each line with tracking and line spacing
-        base_line_height = self.font.get_linesize()
+        base_line_height = _linesize(self.font)
         line_height = int(base_line_height * self.line_spacing)
+        # A line of width w starts at self.x - (w * align_shift) // 2, which
+        # matches Rect's left / centerx / right placement
+        align_shift = {"center": 1, "right": 2}.get(self.align, 0)
+        rendered_lines = []
         for i, line in enumerate(wrapped_lines):
             if not line:  # Blank line
                 self._height += line_height
@@ -937,38 +1352,57 @@ class Label:
                 # Normal rendering
                 line_surf = self.font.render(line, True, self.color)
             else:
-                # Render per-character to apply tracking
-                parts = [self.font.render(ch, True, self.color) for ch in line]
-                width = sum(p.get_width() for p in parts) + self.tracking * (
-                    len(parts) - 1
-                )
-                line_surf = pygame.Surface((width, base_line_height), pygame.SRCALPHA)
+                # Place cached per-character glyphs to apply tracking
+                parts = []
                 x_offset = 0
-                for p in parts:
-                    line_surf.blit(p, (x_offset, 0))
-                    x_offset += p.get_width() + self.tracking
+                for ch in line:
+                    glyph = get_glyph(self.font, self.color, ch)
+                    parts.append((glyph, (x_offset, 0)))
+                    x_offset += glyph.get_width() + self.tracking
+                width = x_offset - self.tracking
+                line_surf = pygame.Surface((width, base_line_height), pygame.SRCALPHA)
+                # Transparent pixels take the text color so blending the
+                # antialiased glyph edges does not darken them
+                line_surf.fill((*self.color[:3], 0))
+                line_surf.blits(parts, doreturn=False)
 
-            line_rect = line_surf.get_rect()
+            line_width = line_surf.get_width()
 
             # Track maximum width
-            self._width = max(self._width, line_rect.width)
-
-            # Position based on alignment
-            if self.align == "center":
-                line_rect.centerx = self.x
-            elif self.align == "right":
-                line_rect.right = self.x
-            else:  # left
-                line_rect.left = self.x
+            self._width = max(self._width, line_width)
 
-            line_rect.top = self.y + i * line_height
-
-            self._rendered_lines.append((line_surf, line_rect))
+            rendered_lines.append(
+                (
+                    line_surf,
+                    self.x - (line_width * align_shift) // 2,
+                    self.y + i * line_height,
+                )
+            )
             self._height += line_height
 
+        if not rendered_lines:
+            return
+        left = min(x for _, x, _ in rendered_lines)
+        right = max(x + surf.get_width() for surf, x, _ in rendered_lines)
+        top = rendered_lines[0][2]
+        bottom = max(y + surf.get_height() for surf, _, y in rendered_lines)
+        composite = pygame.Surface((right - left, bottom - top), pygame.SRCALPHA)
+        composite.fill((*self.color[:3], 0))
+        composite.blits(
+            [(surf, (x - left, y - top)) for surf, x, y in rendered_lines],
+            doreturn=False,
+        )
+        # Only the composite is blitted, so it alone needs the display format
+        self._composite = to_display_format(composite)
+        self._composite_pos = (left, top)
+
     def update_text(self, new_text: str) -> None:
-        """Update the label text and re-render"""
-        if self.text != new_text:
+        """Update the label text and re-render.
+
+        Rendering is skipped when neither the text nor any other render
+        input (font, color, layout) has changed since the last render.
+        """
+        if self._render_key(new_text) != self._rendered_key:
             self.text = new_text
             self._render_text()
 
@@ -982,52 +1416,166 @@ class Label:
         """Get the maximum width of wrapped text"""
         return self._width + (self.padding * 2)
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw all rendered text lines"""
-        for line_surf, line_rect in self._rendered_lines:
-            surface.blit(line_surf, line_rect)
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the pre-rendered text"""
+        if self._composite is not None:
+            surface.blit(self._composite, self._composite_pos)
+
+    def get_blits(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Return the (surface, position) pairs that draw the label"""
+        if self._composite is None:
+            return []
+        return [(self._composite, self._composite_pos)]
+
+
+# --- Helper Functions ---
+# Rounded rects, gradients and shadows are rendered once per shape and color
+# and kept in LRU caches of this size, which also bounds them during resizing
+_SHAPE_CACHE_SIZE = 256
+
+
+def draw_shadow(
+    surface: pygame.Surface,
+    rect: pygame.Rect,
+    corner_radius: int,
+    shadow_offset: int = 3,
+    shadow_color: Tuple = (0, 0, 0, 80),
+    blur_radius: int = 2
+) -> None:
+    """Draw a smooth shadow behind a rectangle with configurable offset and blur"""
+    shadow_surf = _shadow_surface(
+        rect.width, rect.height, corner_radius, tuple(shadow_color), blur_radius
+    )
+
+    # Blit shadow to main surface
+    surface.blit(
+        shadow_surf,
+        (rect.x + shadow_offset - blur_radius, rect.y + shadow_offset - blur_radius),
+    )
+
+
+@functools.lru_cache(maxsize=_SHAPE_CACHE_SIZE)
+def _shadow_surface(
+    width: int, height: int, corner_radius: int, shadow_color: Tuple, blur_radius: int
+) -> pygame.Surface:
+    """Render a shadow shape padded by blur_radius on every side"""
+    # Tint the white blurred mask with the shadow color
+    shadow_surf = _shadow_mask(width, height, corner_radius, blur_radius).copy()
+    color = tuple(shadow_color) if len(shadow_color) == 4 else (*shadow_color, 255)
+    shadow_surf.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+    return shadow_surf
+
+
+@functools.lru_cache(maxsize=_SHAPE_CACHE_SIZE)
+def _shadow_mask(
+    width: int, height: int, corner_radius: int, blur_radius: int
+) -> pygame.Surface:
+    """Render a white rounded-rect silhouette whose alpha is box-blurred"""
+    size = (width + blur_radius * 2, height + blur_radius * 2)
+    silhouette = pygame.Surface(size, pygame.SRCALPHA)
+    draw_rounded_rect_basic(
+        silhouette,
+        pygame.Rect(blur_radius, blur_radius, width, height),
+        (255, 255, 255, 255),
+        corner_radius,
+    )
+    coverage = pygame.surfarray.array_alpha(silhouette).astype(np.float64)
+    if blur_radius > 0:
+        # Separable blur: one running-sum pass per axis
+        coverage = _box_blur_axis0(coverage, blur_radius)
+        coverage = _box_blur_axis0(coverage.T, blur_radius).T
+
+    mask = pygame.Surface(size, pygame.SRCALPHA)
+    mask.fill((255, 255, 255, 0))
+    alpha = pygame.surfarray.pixels_alpha(mask)
+    alpha[:] = coverage.astype(np.uint8)
+    del alpha  # release the pixel view so the surface unlocks
+    return to_display_format(mask)
+
+
+def _box_blur_axis0(values: np.ndarray, radius: int) -> np.ndarray:
+    """Average each entry with its radius neighbours along axis 0"""
+    n = values.shape[0]
+    width = radius * 2 + 1
+    sums = np.cumsum(np.pad(values, ((radius + 1, radius), (0, 0))), axis=0)
+    return (sums[width:] - sums[:n]) / width
+
+
+def draw_rounded_top_rect(
+    surface: pygame.Surface,
+    rect: pygame.Rect,
+    color: Tuple[int, ...],
+    radius: int,
+) -> None:
+    """Fill rect with only its top corners rounded, reusing cached shapes"""
+    if radius <= 0:
+        pygame.draw.rect(surface, color, rect)
+        return
+    surface.blit(
+        _rounded_top_surface(rect.width, rect.height, radius, tuple(color)), rect.topleft
+    )
+
+
+@functools.lru_cache(maxsize=_SHAPE_CACHE_SIZE)
+def _rounded_top_surface(w: int, h: int, radius: int, color: Tuple) -> pygame.Surface:
+    """Render a fill with rounded top corners"""
+    shape = pygame.Surface((w, h), pygame.SRCALPHA)
+    pygame.draw.polygon(
+        shape,
+        color,
+        [(radius, 0), (w - radius, 0), (w - radius, radius), (w, radius),
+         (w, h), (0, h), (0, radius), (radius, radius)],
+    )
+    pygame.draw.circle(shape, color, (radius, radius), radius)
+    pygame.draw.circle(shape, color, (w - radius, radius), radius)
+    return to_display_format(shape)
 
 
-# --- Helper Functions ---
-def draw_shadow(
-    surface: pygame.Surface,
-    rect: pygame.Rect,
+def _gradient_ramp(start_color: Tuple, end_color: Tuple, steps: int) -> np.ndarray:
+    """Return a (steps, channels) uint8 array blending start_color to end_color"""
+    factor = np.linspace(0.0, 1.0, steps) if steps > 1 else np.zeros(steps)
+    return (
+        np.asarray(start_color, dtype=np.float64) * (1.0 - factor[:, None])
+        + np.asarray(end_color, dtype=np.float64) * factor[:, None]
+    ).astype(np.uint8)
+
+
+@functools.lru_cache(maxsize=_SHAPE_CACHE_SIZE)
+def _render_rounded_gradient(
+    size: Tuple[int, int],
+    start_color: Tuple[int, int, int, int],
+    end_color: Tuple[int, int, int, int],
     corner_radius: int,
-    shadow_offset: int = 3,
-    shadow_color: Tuple = (0, 0, 0, 80),
-    blur_radius: int = 2
-) -> None:
-    """Draw a smooth shadow behind a rectangle with configurable offset and blur"""
-    # Create shadow rect with offset
-    shadow_rect = rect.copy()
-    shadow_rect.x += shadow_offset
-    shadow_rect.y += shadow_offset
-    
-    # Create a temporary surface with alpha for the shadow
-    shadow_surf = pygame.Surface((rect.width + blur_radius*2, rect.height + blur_radius*2), pygame.SRCALPHA)
-    
-    # Base shadow shape
+    direction: str = "vertical",
+) -> pygame.Surface:
+    """Build a rounded rect filled with a linear gradient using numpy"""
+    width, height = size
+    ramp = _gradient_ramp(
+        start_color, end_color, height if direction == "vertical" else width
+    )
+
+    # Rounded shape as a coverage mask, rasterized like the borders drawn
+    # over it so fill and outline corners line up
+    mask_surf = pygame.Surface(size, pygame.SRCALPHA)
     draw_rounded_rect_basic(
-        shadow_surf, 
-        pygame.Rect(blur_radius, blur_radius, rect.width, rect.height),
-        shadow_color, 
-        corner_radius
+        mask_surf, pygame.Rect(0, 0, width, height), (255, 255, 255, 255), corner_radius
     )
-    
-    # Apply a simple blur effect by drawing multiple transparent shadows
-    if blur_radius > 0:
-        for i in range(1, blur_radius + 1):
-            blur_color = (shadow_color[0], shadow_color[1], shadow_color[2], shadow_color[3] // (i*2))
-            blur_rect = pygame.Rect(
-                blur_radius - i, 
-                blur_radius - i, 
-                rect.width + i*2, 
-                rect.height + i*2
-            )
-            draw_rounded_rect_basic(shadow_surf, blur_rect, blur_color, corner_radius + i)
-    
-    # Blit shadow to main surface
-    surface.blit(shadow_surf, (shadow_rect.x - blur_radius, shadow_rect.y - blur_radius))
+    inside = pygame.surfarray.array_alpha(mask_surf) > 0
+
+    # surfarray views are indexed (x, y)
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    rgb = pygame.surfarray.pixels3d(surf)
+    alpha = pygame.surfarray.pixels_alpha(surf)
+    if direction == "vertical":
+        rgb[:] = ramp[None, :, :3]
+        alpha[:] = ramp[None, :, 3]
+    else:
+        rgb[:] = ramp[:, None, :3]
+        alpha[:] = ramp[:, None, 3]
+    alpha[~inside] = 0
+    del rgb, alpha  # release the pixel views so the surface unlocks
+    return to_display_format(surf)
+
 
 def draw_rounded_rect(
     surface: pygame.Surface,
@@ -1052,6 +1600,12 @@ def draw_rounded_rect(
     - gradient_direction: "vertical" or "horizontal"
     - gradient_end_color: end color for gradient (defaults to lighter version of color)
     """
+    # Opaque solid fills and outlines are one native draw; none of the alpha,
+    # radius and gradient handling below applies to them
+    if not gradient and (len(color) == 3 or color[3] == 255):
+        draw_rounded_rect_basic(surface, rect, color, corner_radius, border_width)
+        return
+
     # Handle alpha if provided
     has_alpha = len(color) == 4
     
@@ -1070,11 +1624,8 @@ def draw_rounded_rect(
     # Adjust radius if it's too large for the rect
     corner_radius = min(corner_radius, rect.width // 2, rect.height // 2)
 
-    # For gradient, we need a temporary surface with alpha support
+    # Gradients are rendered once per shape and colors, then reused
     if gradient and not border_width:
-        # Create a temporary surface with per-pixel alpha
-        temp_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        
         # Set up gradient end color if not provided
         if not gradient_end_color:
             # Default to a lighter version of the base color
@@ -1086,105 +1637,60 @@ def draw_rounded_rect(
                 color[3]
             )
         
-        # Draw basic rounded rect on temp surface
-        draw_rounded_rect_basic(temp_surf, pygame.Rect(0, 0, rect.width, rect.height),
-                         color, corner_radius, border_width=0)
-        
-        # Apply gradient effect
-        apply_gradient(temp_surf, pygame.Rect(0, 0, rect.width, rect.height),
-                      color, gradient_end_color, gradient_direction)
-        
+        if len(gradient_end_color) == 3:
+            gradient_end_color = (*gradient_end_color, 255)
+
+        temp_surf = _render_rounded_gradient(
+            tuple(rect.size), tuple(color), tuple(gradient_end_color),
+            corner_radius, gradient_direction,
+        )
+
         # Blit to main surface
         surface.blit(temp_surf, rect.topleft)
         return
     
-    # For non-gradient or border, use the standard drawing
-    if border_width:
-        # For borders, we need to draw lines connecting the arcs
-        # Top horizontal line
-        pygame.draw.line(
-            surface,
-            color,
-            (rect.left + corner_radius, rect.top),
-            (rect.right - corner_radius, rect.top),
-            border_width,
-        )
-        # Bottom horizontal line
-        pygame.draw.line(
-            surface,
-            color,
-            (rect.left + corner_radius, rect.bottom),
-            (rect.right - corner_radius, rect.bottom),
-            border_width,
-        )
-        # Left vertical line
-        pygame.draw.line(
-            surface,
-            color,
-            (rect.left, rect.top + corner_radius),
-            (rect.left, rect.bottom - corner_radius),
-            border_width,
-        )
-        # Right vertical line
-        pygame.draw.line(
-            surface,
-            color,
-            (rect.right, rect.top + corner_radius),
-            (rect.right, rect.bottom - corner_radius),
-            border_width,
-        )
+    # Translucent filled and outlined shapes are rendered once and reused
+    surface.blit(*rounded_rect_blit(rect, color, corner_radius, border_width))
+
+
+def rounded_rect_blit(
+    rect: pygame.Rect, color: Tuple, corner_radius: int, border_width: int = 0
+) -> Tuple[pygame.Surface, Tuple[int, int]]:
+    """Return a (surface, position) pair for a solid rounded rect.
+
+    Draws the same shape as draw_rounded_rect without a gradient, for
+    callers that batch their blits.
+    """
+    if len(color) == 3:
+        color = (*color, 255)
+    corner_radius = max(0, min(corner_radius, rect.width // 2, rect.height // 2))
+    return (
+        _rounded_rect_surface(
+            rect.width, rect.height, corner_radius, tuple(color), border_width
+        ),
+        rect.topleft,
+    )
+
+
+@functools.lru_cache(maxsize=_SHAPE_CACHE_SIZE)
+def _rounded_rect_surface(
+    width: int, height: int, corner_radius: int, color: Tuple, border_width: int
+) -> pygame.Surface:
+    """Render a filled or outlined rounded rect"""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    draw_rounded_rect_basic(
+        surface, pygame.Rect(0, 0, width, height), color, corner_radius, border_width
+    )
+    return to_display_format(surface)
+
+
+@functools.lru_cache(maxsize=_SHAPE_CACHE_SIZE)
+def _dot_surface(color: Tuple, radius: int) -> pygame.Surface:
+    """Render a filled circle centred at (radius, radius)"""
+    dot = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+    pygame.draw.circle(dot, color, (radius, radius), radius)
+    return to_display_format(dot)
 
-        # Draw the corner arcs with anti-aliasing
-        pygame.draw.arc(
-            surface,
-            color,
-            pygame.Rect(rect.left, rect.top, corner_radius * 2, corner_radius * 2),
-            3 * math.pi / 2,
-            2 * math.pi,
-            border_width,
-        )
-        pygame.draw.arc(
-            surface,
-            color,
-            pygame.Rect(
-                rect.right - corner_radius * 2,
-                rect.top,
-                corner_radius * 2,
-                corner_radius * 2,
-            ),
-            0,
-            math.pi / 2,
-            border_width,
-        )
-        pygame.draw.arc(
-            surface,
-            color,
-            pygame.Rect(
-                rect.left,
-                rect.bottom - corner_radius * 2,
-                corner_radius * 2,
-                corner_radius * 2,
-            ),
-            math.pi,
-            3 * math.pi / 2,
-            border_width,
-        )
-        pygame.draw.arc(
-            surface,
-            color,
-            pygame.Rect(
-                rect.right - corner_radius * 2,
-                rect.bottom - corner_radius * 2,
-                corner_radius * 2,
-                corner_radius * 2,
-            ),
-            math.pi / 2,
-            math.pi,
-            border_width,
-        )
-    else:
-        # Use the basic filled drawing method
-        draw_rounded_rect_basic(surface, rect, color, corner_radius)
 
 def draw_rounded_rect_basic(
     surface: pygame.Surface,
@@ -1194,165 +1700,78 @@ def draw_rounded_rect_basic(
     border_width: int = 0,
 ) -> None:
     """Basic implementation of rounded rectangle drawing without gradients"""
-    if border_width:
-        # Draw border implementation
-        pygame.draw.rect(
-            surface,
-            color,
-            pygame.Rect(
-                rect.left + corner_radius,
-                rect.top,
-                rect.width - 2 * corner_radius,
-                rect.height,
-            ),
-            border_width,
-        )
-        pygame.draw.rect(
-            surface,
-            color,
-            pygame.Rect(
-                rect.left,
-                rect.top + corner_radius,
-                rect.width,
-                rect.height - 2 * corner_radius,
-            ),
-            border_width,
-        )
-    else:
-        # For filled rects, draw filled shapes and connect them
-        # Draw the main rect
-        pygame.draw.rect(
-            surface,
-            color,
-            pygame.Rect(
-                rect.left + corner_radius,
-                rect.top,
-                rect.width - 2 * corner_radius,
-                rect.height,
-            ),
-        )
-        # Draw side rects
-        pygame.draw.rect(
-            surface,
-            color,
-            pygame.Rect(
-                rect.left,
-                rect.top + corner_radius,
-                corner_radius,
-                rect.height - 2 * corner_radius,
-            ),
-        )
-        pygame.draw.rect(
-            surface,
-            color,
-            pygame.Rect(
-                rect.right - corner_radius,
-                rect.top + corner_radius,
-                corner_radius,
-                rect.height - 2 * corner_radius,
-            ),
-        )
-
-        # Draw the corner circles for smoother corners
-        pygame.draw.circle(
-            surface, color, (rect.left + corner_radius, rect.top + corner_radius), corner_radius
-        )
-        pygame.draw.circle(
-            surface,
-            color,
-            (rect.right - corner_radius, rect.top + corner_radius),
-            corner_radius,
-        )
-        pygame.draw.circle(
-            surface,
-            color,
-            (rect.left + corner_radius, rect.bottom - corner_radius),
-            corner_radius,
-        )
-        pygame.draw.circle(
-            surface,
-            color,
-            (rect.right - corner_radius, rect.bottom - corner_radius),
-            corner_radius,
-        )
-
-def apply_gradient(
-    surface: pygame.Surface,
-    rect: pygame.Rect,
-    start_color: Tuple,
-    end_color: Tuple,
-    direction: str = "vertical"
-) -> None:
-    """Apply a gradient effect to the surface within the given rect"""
-    # Create a gradient array
-    if direction == "vertical":
-        gradient_size = rect.height
-    else:  # horizontal
-        gradient_size = rect.width
-    
-    # Create gradient surface
-    gradient = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-    
-    # Blend colors across the gradient
-    for i in range(gradient_size):
-        # Calculate blend factor (0.0 to 1.0)
-        factor = i / float(gradient_size - 1) if gradient_size > 1 else 0
-        
-        # Interpolate between colors
-        r = int(start_color[0] * (1 - factor) + end_color[0] * factor)
-        g = int(start_color[1] * (1 - factor) + end_color[1] * factor)
-        b = int(start_color[2] * (1 - factor) + end_color[2] * factor)
-        a = int(start_color[3] * (1 - factor) + end_color[3] * factor)
-        
-        # Draw a line of the gradient
-        if direction == "vertical":
-            pygame.draw.line(gradient, (r, g, b, a), (0, i), (rect.width, i))
-        else:
-            pygame.draw.line(gradient, (r, g, b, a), (i, 0), (i, rect.height))
-            
-    # Apply gradient with alpha blending
-    surface.blit(gradient, (0, 0))
+    pygame.draw.rect(surface, color, rect, border_width, border_radius=corner_radius)
 
 
 def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> List[str]:
     """Wrap text to fit within a given width"""
+    return list(_wrap_line(text, font, max_width))
+
+
+# Keyed on the font object itself, like _text_width, so a freed font's id can
+# never alias a live one
+@functools.lru_cache(maxsize=1024)
+def _wrap_line(text: str, font: pygame.font.Font, max_width: int) -> Tuple[str, ...]:
+    """Wrap one line of text, memoized; see wrap_text"""
     words = text.split(" ")
     lines = []
     current_line = []
+    # Width of current_line, kept as a running sum of word and space widths
+    # so each word is measured once instead of re-measuring the whole line
+    current_width = 0
+    space_width = _text_width(font, " ")
 
     for word in words:
         # Test width with this word added
-        test_line = " ".join(current_line + [word])
-        test_width = font.size(test_line)[0]
+        word_width = _text_width(font, word)
+        if current_line:
+            test_width = current_width + space_width + word_width
+            # Kerning makes the sum drift from the true width by a pixel or
+            # so per word; near the limit, measure the actual line instead
+            if test_width > max_width - 2 * len(current_line) - 2:
+                test_width = _text_width(font, " ".join(current_line + [word]))
+        else:
+            test_width = word_width
 
         if test_width <= max_width:
             current_line.append(word)
+            current_width = test_width
         else:
             # Line would be too long, start a new one
             if current_line:  # Add the current line if it has content
                 lines.append(" ".join(current_line))
                 current_line = [word]
+                current_width = word_width
             else:
                 # Handle case where a single word is too long
                 lines.append(word)
                 current_line = []
+                current_width = 0
 
     # Add the last line if there's content
     if current_line:
         lines.append(" ".join(current_line))
 
-    return lines
-
-def find_font_for_width(text: str, max_width: int, base_font: Optional[pygame.font.Font] = None, 
-                       max_size: int = 48, min_size: int = 12) -> pygame.font.Font:
-    """Find the largest font size that fits text within the given width"""
-    for size in range(max_size, min_size - 1, -1):
-        font = pygame.font.Font(None, size)
-        if font.size(text)[0] <= max_width:
-            return font
-    return pygame.font.Font(None, min_size)
+    return tuple(lines)
+
+def split_text_lines(
+    text: str, font: pygame.font.Font, max_width: Optional[int] = None
+) -> List[str]:
+    """Split text into the display lines a Label would render"""
+    # If max width is set, wrap text using font-aware measurement
+    if max_width:
+        wrapped_lines = []
+        for line in text.splitlines():
+            if not line:
+                wrapped_lines.append("")
+                continue
+            wrapped_lines.extend(_wrap_line(line, font, max_width))
+        return wrapped_lines
+    # No wrapping, just split on newlines
+    return text.splitlines()
 
 
+@functools.lru_cache(maxsize=64)
 def find_font_for_width(
     text: str,
     max_width: int,
@@ -1362,17 +1781,20 @@ def find_font_for_width(
 ) -> pygame.font.Font:
     """Return a pygame Font sized so 'text' fits within max_width on one line if possible.
 
-    The function tries sizes from max_size down to min_size and returns the first
-    font whose rendered width is <= max_width. If none fit, returns the font at
-    min_size (the Label will then wrap if a max_width is supplied).
+    Text width grows with font size, so the largest fitting size between
+    min_size and max_size is found by binary search. If none fit, returns the
+    font at min_size (the Label will then wrap if a max_width is supplied).
+    Results are memoized per (text, max_width, font, size range), as menu
+    relayouts ask for the same fit on every resize.
     """
-    # Try larger sizes first to keep the title visually prominent
-    for size in range(max_size, min_size - 1, -1):
-        f = pygame.font.Font(font_name, size)
-        w, _ = f.size(text)
-        if w <= max_width:
-            return f
-    return pygame.font.Font(font_name, min_size)
+    lo, hi = min_size, max_size
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if _text_width(_get_font(font_name, mid), text) <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return _get_font(font_name, lo)
 
 
 # --- UI Screens ---
@@ -1380,26 +1802,110 @@ def find_font_for_width(
 # Save path
 SAVE_PATH = os.path.join(os.path.dirname(__file__), "simulation_state.json")
 
-# Initialize screen with resizable flag
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
-pygame.display.set_caption("USA Political Simulation")
+# Display surface, created by init_display()
+screen: Optional[pygame.Surface] = None
+
+
+def init_display() -> pygame.Surface:
+    """Initialize pygame, fonts and the resizable window once; return the screen"""
+    global screen
+    if screen is None:
+        pygame.init()
+        Fonts.init()
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
+        pygame.display.set_caption("USA Political Simulation")
+    return screen
+
+
+def resize_display(size: Tuple[int, int]) -> bool:
+    """Resize the window to size and refresh the scale factors.
+
+    Returns False, without touching the window, when it already has that
+    size (set_mode itself reports one, and drags can end where they began).
+    """
+    global SCREEN_WIDTH, SCREEN_HEIGHT, screen
+    if tuple(size) == (SCREEN_WIDTH, SCREEN_HEIGHT):
+        return False
+    SCREEN_WIDTH, SCREEN_HEIGHT = size
+    update_scale()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
+    return True
+
+
+def make_menu_background(
+    width: int, height: int, dest: Optional[pygame.Surface] = None
+) -> pygame.Surface:
+    """Build the menu's vertical navy-to-blue gradient.
+
+    The gradient is computed as a single column with numpy and stretched to
+    the window width, into dest (which must be width x height) when given.
+    """
+    # Gradient from navy to lighter blue
+    ys = np.arange(height) / height
+    column = np.empty((1, height, 3), dtype=np.uint8)
+    column[0, :, 0] = 32 + (ys * 20).astype(np.uint8)
+    column[0, :, 1] = 34 + (ys * 20).astype(np.uint8)
+    column[0, :, 2] = 48 + (ys * 60).astype(np.uint8)
+    column_surf = pygame.surfarray.make_surface(column)
+    if dest is None:
+        return pygame.transform.scale(column_surf, (width, height))
+    return pygame.transform.scale(column_surf, (width, height), dest)
+
+
+# Mouse events whose effects widgets track themselves (see GameScreen.handle_events)
+POINTER_EVENT_TYPES = frozenset(
+    (pygame.MOUSEMOTION, pygame.MOUSEWHEEL, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+)
+
+# Event types the main menu reacts to; everything else is kept off its queue
+MENU_EVENT_TYPES = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.VIDEORESIZE,
+    pygame.VIDEOEXPOSE,
+]
+
+
+# Event types the game screen reacts to
+GAME_EVENT_TYPES = MENU_EVENT_TYPES + [pygame.MOUSEWHEEL]
+
+
+def _allow_menu_events() -> None:
+    """Restrict the event queue to the types the main menu handles"""
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(MENU_EVENT_TYPES)
+
+
+def _allow_game_events() -> None:
+    """Restrict the event queue to the types the game screen handles"""
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(GAME_EVENT_TYPES)
 
 
 class MainMenu:
     """Main menu screen with stylish buttons"""
 
     def __init__(self):
+        init_display()
         self.buttons = []
         self.selected_index = 0
-
-        # Create background gradient
-        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        for y in range(SCREEN_HEIGHT):
-            # Gradient from navy to lighter blue
-            r = 32 + int((y / SCREEN_HEIGHT) * 20)
-            g = 34 + int((y / SCREEN_HEIGHT) * 20)
-            b = 48 + int((y / SCREEN_HEIGHT) * 60)
-            pygame.draw.line(self.background, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        # The first frame (and any frame after a resize/expose) presents the
+        # whole window; afterwards only the button rects can change on screen
+        self._full_redraw = True
+        self._dirty = True
+        # Button the selection dot was last drawn on
+        self._drawn_selected = self.selected_index
+        # Latest VIDEORESIZE size, applied once the window stops changing
+        self._pending_resize: Optional[Tuple[int, int]] = None
+        self._last_resize_t = 0.0
+
+        # Create background gradient. It is drawn into a pooled surface that
+        # only grows, so resizing the window rarely allocates a new one.
+        self._bg_pool: Optional[pygame.Surface] = None
+        self._build_background()
 
         # Set up menu panel
         panel_width = 400
@@ -1490,9 +1996,14 @@ class MainMenu:
             align="center",
         )
 
-    def start_game(self) -> None:
-        game_screen = GameScreen()
+    def _run_game(self, game_screen: "GameScreen") -> None:
+        """Run a game screen, restoring the menu's event filter afterwards"""
         game_screen.run()
+        _allow_menu_events()
+        self._full_redraw = True
+
+    def start_game(self) -> None:
+        self._run_game(GameScreen())
 
     def load_game(self) -> None:
         loaded = None
@@ -1502,23 +2013,33 @@ class MainMenu:
             except Exception:
                 loaded = None
 
-        game_screen = GameScreen(loaded_state=loaded)
-        game_screen.run()
+        self._run_game(GameScreen(loaded_state=loaded))
 
     def quit_game(self) -> None:
         pygame.quit()
         sys.exit()
         
+    def _build_background(self) -> None:
+        """Render the background gradient into the pool at the window size"""
+        pool_w, pool_h = self._bg_pool.get_size() if self._bg_pool else (0, 0)
+        if SCREEN_WIDTH > pool_w or SCREEN_HEIGHT > pool_h:
+            # Grow with headroom so a drag-resize doesn't reallocate every step
+            size = (
+                max(SCREEN_WIDTH, int(pool_w * 1.5)),
+                max(SCREEN_HEIGHT, int(pool_h * 1.5)),
+            )
+            self._bg_pool = to_display_format(pygame.Surface(size), alpha=False)
+        self.background = make_menu_background(
+            SCREEN_WIDTH,
+            SCREEN_HEIGHT,
+            self._bg_pool.subsurface((0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)),
+        )
+
     def _update_layout(self) -> None:
         """Update layout when screen is resized"""
-        # Recreate background with new dimensions
-        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        for y in range(SCREEN_HEIGHT):
-            # Gradient from navy to lighter blue
-            r = 32 + int((y / SCREEN_HEIGHT) * 20)
-            g = 34 + int((y / SCREEN_HEIGHT) * 20)
-            b = 48 + int((y / SCREEN_HEIGHT) * 60)
-            pygame.draw.line(self.background, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        self._full_redraw = True
+        # Redraw background with new dimensions
+        self._build_background()
         
         # Update panel position and size
         panel_width = scale_value(400)
@@ -1558,30 +2079,35 @@ class MainMenu:
             button.rect.width = button_width
             button.rect.height = button_height
 
-    def handle_events(self) -> bool:
+    def handle_events(self, events: Optional[List[pygame.event.Event]] = None) -> bool:
         """Process events and return False if should exit menu"""
-        mouse_pos = pygame.mouse.get_pos()
-
-        # Update all buttons
-        for button in self.buttons:
-            button.update(mouse_pos)
-
-        # Check if mouse is hovering over any button to update selected_index
-        for i, button in enumerate(self.buttons):
-            if button._hovered:
-                self.selected_index = i
+        if events is None:
+            events = pygame.event.get()
+
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                # Hover comes from the motion event itself; only a change in
+                # hovered button needs a redraw
+                if update_hover(self.buttons, event.pos):
+                    self._dirty = True
+                    for i, button in enumerate(self.buttons):
+                        if button._hovered:
+                            self.selected_index = i
+            else:
+                self._dirty = True
 
-        for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
                 
             elif event.type == pygame.VIDEORESIZE:
-                # Handle window resize
-                global SCREEN_WIDTH, SCREEN_HEIGHT, screen
-                SCREEN_WIDTH, SCREEN_HEIGHT = event.size
-                screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
-                self._update_layout()
+                # Resizes arrive in bursts while the window is dragged; only
+                # the last size is laid out, see _apply_pending_resize
+                self._pending_resize = event.size
+                self._last_resize_t = time.perf_counter()
+
+            elif event.type == pygame.VIDEOEXPOSE:
+                self._full_redraw = True
 
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
@@ -1602,57 +2128,121 @@ class MainMenu:
                 if button.handle_event(event):
                     return False
 
+        self._apply_pending_resize()
         return True
 
+    def _apply_pending_resize(self) -> None:
+        """Resize and relayout once the window size has settled"""
+        if (
+            self._pending_resize
+            and time.perf_counter() - self._last_resize_t >= RESIZE_SETTLE_S
+        ):
+            if resize_display(self._pending_resize):
+                self._update_layout()
+            self._pending_resize = None
+
     def draw(self) -> None:
-        """Render the menu screen"""
-        # Draw background gradient
-        screen.blit(self.background, (0, 0))
+        """Render the menu screen.
 
-        # Draw panel
-        self.panel.draw(screen)
+        Between full redraws only hover, press and selection change, so only
+        the buttons they affect are repainted and presented.
+        """
+        if self._full_redraw:
+            changed = self.buttons
+        else:
+            moved = self.selected_index != self._drawn_selected
+            changed = [
+                button
+                for i, button in enumerate(self.buttons)
+                if button._dirty
+                or (moved and i in (self.selected_index, self._drawn_selected))
+            ]
+            if not changed:
+                return
+        prev_clip = screen.get_clip()
+        if not self._full_redraw:
+            screen.set_clip(changed[0].rect.unionall([b.rect for b in changed[1:]]))
 
-        # Draw title and subtitle
-        self.title.draw(screen)
-        self.subtitle.draw(screen)
+        # Everything is collected into one list and blitted in a single call
+        # (clipped to the changed buttons unless redrawing fully):
+        # background gradient, panel, title and subtitle first
+        blits = [(self.background, (0, 0)), self.panel.chrome_blit()]
+        blits += self.title.get_blits()
+        blits += self.subtitle.get_blits()
 
-        # Draw menu buttons
+        # Menu buttons
         for i, button in enumerate(self.buttons):
-            # First draw the button
-            button.draw(screen)
+            blits += button.get_blits()
 
             # Then add selection indicator if this button is selected
             if i == self.selected_index:
-                # Calculate indicator positions
-                circle_x = button.rect.x + 20  # Place inside the button
-                circle_y = button.rect.y + (button.rect.height // 2)
-
-                # Draw a dot inside the button
-                pygame.draw.circle(screen, Colors.PRIMARY, (circle_x, circle_y), 5)
+                # A dot inside the button, centred 20px from its left edge
+                dot = _dot_surface(tuple(Colors.PRIMARY), 5)
+                blits.append(
+                    (dot, (button.rect.x + 15, button.rect.y + button.rect.height // 2 - 5))
+                )
 
-        # Draw footer
-        self.footer.draw(screen)
+        # Footer
+        blits += self.footer.get_blits()
+        blit_all(screen, blits)
+        screen.set_clip(prev_clip)
 
-        pygame.display.flip()
+        for button in changed:
+            mark_dirty(button.rect)
+            button._dirty = False
+        self._drawn_selected = self.selected_index
+        present(full=self._full_redraw)
+        self._full_redraw = False
 
     def run(self) -> None:
         """Main menu loop"""
-        clock = pygame.time.Clock()
+        _allow_menu_events()
+        self._dirty = True
 
         running = True
         while running:
-            running = self.handle_events()
-            self.draw()
-            clock.tick(FRAME_RATE)
+            if self._dirty or self._full_redraw:
+                self.draw()
+                self._dirty = False
+            # The menu only changes on input, so block until there is some
+            # (or until a pending resize is due)
+            if self._pending_resize:
+                events = [pygame.event.wait(int(RESIZE_SETTLE_S * 1000))]
+            else:
+                events = [pygame.event.wait()]
+            events.extend(pygame.event.get())
+            running = self.handle_events(events)
 
 
 class GameScreen:
     """Game screen with simulation view and controls"""
 
     def __init__(self, loaded_state: Optional[UnitedStates] = None, seed: int = 42):
+        init_display()
         self.us = loaded_state if loaded_state else UnitedStates.new_default(seed=seed)
         self.info_msg = None
         self.info_timer = 0
+        # Set whenever input or simulation state changes; cleared after drawing
+        self._dirty = True
+        # Latest VIDEORESIZE size, applied once the window stops changing
+        self._pending_resize: Optional[Tuple[int, int]] = None
+        self._last_resize_t = 0.0
+        # State shown by the last update_ui; see _ui_signature
+        self._ui_signature_seen: Optional[Tuple] = None
+        # Pointer position button hover was last computed for; None forces a refresh
+        self._last_mouse_pos: Optional[Tuple[int, int]] = None
+        # Log label, reused until its text or panel changes; see _sync_log_label
+        self._log_label: Optional[Label] = None
+        self._log_label_key: Optional[Tuple] = None
+        # Info message panel and label, repositioned and restyled per frame;
+        # see _make_info_panel
+        self._info_panel = Panel(
+            rect=pygame.Rect(0, 0, 400, 50),
+            bg_color=(50, 50, 60, 200),
+            border_color=None,
+            corner_radius=CORNER_RADIUS,
+        )
+        self._info_label = Label("", x=0, y=0, font=Fonts.NORMAL, align="center")
 
         # Create UI components
 
@@ -1712,94 +2302,74 @@ class GameScreen:
             corner_radius=CORNER_RADIUS,
         )
 
+        # Panels in draw order, topmost first for routing input, and the
+        # scrollable ones
+        self._panels = (
+            self.header_panel,
+            self.stats_panel,
+            self.states_panel,
+            self.controls_panel,
+            self.log_panel,
+        )
+        self._panels_topmost_first = self._panels[::-1]
+        self._scroll_panels = (self.stats_panel, self.states_panel, self.log_panel)
+
         # Action buttons - calculate sizes to fit in the controls panel
-        available_height = self.controls_panel.content_rect.height - 20  # Leave some padding
-        num_buttons = 6
-        button_spacing = 8  # Reduced spacing
-        button_height = min(BUTTON_HEIGHT, (available_height - (num_buttons - 1) * button_spacing) // num_buttons)
-        button_width = self.controls_panel.content_rect.width - 20  # Leave padding on sides
-        
-        button_y = self.controls_panel.content_rect.y + 10
-        button_x = self.controls_panel.content_rect.x + 10
+        button_rects = self._button_rects(8, BUTTON_HEIGHT)
 
         self.buttons = {
             "advance1": Button(
-                rect=pygame.Rect(button_x, button_y, button_width, button_height),
+                rect=button_rects[0],
                 text="Advance 1 Month",
                 on_click=lambda: self.advance_turn(1),
                 bg_color=Colors.PRIMARY,
-                hover_color=tuple(min(255, c + 20) for c in Colors.PRIMARY),
+                hover_color=Colors.PRIMARY_HOVER,
                 text_color=Colors.TEXT_LIGHT,
                 font=Fonts.NORMAL,  # Use smaller font
                 border_color=None,
             ),
             "advance12": Button(
-                rect=pygame.Rect(
-                    button_x,
-                    button_y + button_height + button_spacing,
-                    button_width,
-                    button_height,
-                ),
+                rect=button_rects[1],
                 text="Advance 1 Year",
                 on_click=lambda: self.advance_turn(12),
                 bg_color=Colors.SECONDARY,
-                hover_color=tuple(min(255, c + 20) for c in Colors.SECONDARY),
+                hover_color=Colors.SECONDARY_HOVER,
                 text_color=Colors.TEXT_LIGHT,
                 font=Fonts.BUTTON,
                 border_color=None,
             ),
             "event": Button(
-                rect=pygame.Rect(
-                    button_x,
-                    button_y + (button_height + button_spacing) * 2,
-                    button_width,
-                    button_height,
-                ),
+                rect=button_rects[2],
                 text="Trigger Event",
                 on_click=self.trigger_event,
                 bg_color=Colors.ACCENT,
-                hover_color=tuple(min(255, c + 20) for c in Colors.ACCENT),
+                hover_color=Colors.ACCENT_HOVER,
                 text_color=Colors.TEXT_DARK,
                 font=Fonts.BUTTON,
                 border_color=None,
             ),
             "save": Button(
-                rect=pygame.Rect(
-                    button_x,
-                    button_y + (button_height + button_spacing) * 3,
-                    button_width,
-                    button_height,
-                ),
+                rect=button_rects[3],
                 text="Save Game",
                 on_click=self.save_game,
                 bg_color=Colors.SUCCESS,
-                hover_color=tuple(min(255, c + 20) for c in Colors.SUCCESS),
+                hover_color=Colors.SUCCESS_HOVER,
                 text_color=Colors.TEXT_LIGHT,
                 font=Fonts.BUTTON,
                 border_color=None,
             ),
             "load": Button(
-                rect=pygame.Rect(
-                    button_x,
-                    button_y + (button_height + button_spacing) * 4,
-                    button_width,
-                    button_height,
-                ),
+                rect=button_rects[4],
                 text="Load Game",
                 on_click=self.load_game,
                 bg_color=Colors.WARNING,
-                hover_color=tuple(min(255, c + 20) for c in Colors.WARNING),
+                hover_color=Colors.WARNING_HOVER,
                 text_color=Colors.TEXT_DARK,
                 font=Fonts.BUTTON,
                 border_color=None,
             ),
             "menu": Button(
-                rect=pygame.Rect(
-                    button_x,
-                    button_y + (button_height + button_spacing) * 5,
-                    button_width,
-                    button_height,
-                ),
+                rect=button_rects[5],
                 text="Return to Menu",
                 on_click=self.return_to_menu,
                 bg_color=(100, 100, 100),
@@ -1829,10 +2399,9 @@ class GameScreen:
         # Placeholder for other dynamic labels
         self.labels = {}
 
-        # Create initial log text
-        self.log_text = "\n".join(
-            self.us.log[-12:] if self.us.log else ["No events yet."]
-        )
+        # Create initial log text; rejoined only when the tail changes
+        self._log_tail: Tuple[str, ...] = tuple(self.us.tail_log(12))
+        self.log_text = self._join_log(self._log_tail)
 
     def advance_turn(self, months: int) -> None:
         """Advance the simulation by given months"""
@@ -1894,9 +2463,12 @@ class GameScreen:
         self.info_msg = message
         self.info_color = color
         self.info_timer = 180  # frames (3 seconds at 60 FPS)
+        self._dirty = True
         
     def _update_layout(self) -> None:
         """Update layout when screen is resized"""
+        # Buttons move, so recheck hover on the next frame
+        self._last_mouse_pos = None
         # Update header panel
         self.header_panel.rect = scale_rect(pygame.Rect(PADDING, PADDING, BASE_SCREEN_WIDTH - PADDING * 2, 120))
         self.header_panel._update_content_rect()
@@ -1929,38 +2501,68 @@ class GameScreen:
         self.log_panel._update_content_rect()
         
         # Update button positions and sizes
-        available_height = self.controls_panel.content_rect.height - 20
-        num_buttons = 6
-        button_spacing = scale_value(8)
-        button_height = min(scale_value(BUTTON_HEIGHT), (available_height - (num_buttons - 1) * button_spacing) // num_buttons)
-        button_width = self.controls_panel.content_rect.width - 20
-        
-        button_y = self.controls_panel.content_rect.y + 10
-        button_x = self.controls_panel.content_rect.x + 10
-        
-        buttons_info = [
-            ("advance1", 0),
-            ("advance12", 1),
-            ("event", 2),
-            ("save", 3),
-            ("load", 4),
-            ("menu", 5)
-        ]
-        
-        for button_key, index in buttons_info:
-            if button_key in self.buttons:
-                self.buttons[button_key].rect = pygame.Rect(
-                    button_x,
-                    button_y + index * (button_height + button_spacing),
-                    button_width,
-                    button_height
-                )
-        
+        button_rects = self._button_rects(scale_value(8), scale_value(BUTTON_HEIGHT))
+        for button, rect in zip(self.buttons.values(), button_rects):
+            button.rect = rect
+
         # Update UI content
         self.update_ui()
 
+    def _button_rects(self, spacing: int, max_height: int) -> List[pygame.Rect]:
+        """Stack the six action buttons down the controls panel, in order"""
+        content = self.controls_panel.content_rect
+        num_buttons = 6
+        # Leave some padding around the stack
+        height = min(max_height, (content.height - 20 - (num_buttons - 1) * spacing) // num_buttons)
+        step = height + spacing
+        x = content.x + 10
+        top = content.y + 10
+        return [
+            pygame.Rect(x, top + i * step, content.width - 20, height)
+            for i in range(num_buttons)
+        ]
+
+    @staticmethod
+    def _join_log(tail: Tuple[str, ...]) -> str:
+        """Text shown in the log panel for the given recent entries"""
+        return "\n".join(tail) if tail else "No events yet."
+
+    def _ui_signature(self, log_tail: Tuple[str, ...]) -> Tuple:
+        """Everything update_ui shows or lays out, compared to skip no-op updates"""
+        us = self.us
+        states = us.states
+        names = us.key_state_names
+        n = len(names)
+        return (
+            us.year,
+            us.month,
+            us.growth,
+            us.unemployment,
+            us.inflation,
+            us.opinion.approval_president,
+            us.opinion.approval_congress,
+            us.budget.revenue,
+            us.budget.spending,
+            us.budget.deficit,
+            names,
+            states.gdp[:n].tobytes(),
+            states.unemployment[:n].tobytes(),
+            tuple(states[name].governor_party for name in names),
+            log_tail,
+            tuple(self.stats_panel.content_rect),
+            tuple(self.states_panel.content_rect),
+            tuple(self.log_panel.content_rect),
+            ThemeManager.CURRENT_THEME,
+        )
+
     def update_ui(self) -> None:
         """Update all dynamic UI elements with current state"""
+        log_tail = tuple(self.us.tail_log(12))
+        signature = self._ui_signature(log_tail)
+        if signature == self._ui_signature_seen:
+            return
+        self._ui_signature_seen = signature
+        self._dirty = True
         # Update header
         self.header_label.update_text(
             f"USA Simulation: Year {self.us.year}  Month {self.us.month:02d}"
@@ -1994,20 +2596,13 @@ class GameScreen:
 
         # Economy lines
         for key, text, color in [
-            ("growth", f"Growth: {self.us.growth*100:.1f}%", growth_color),
-            ("unemployment", f"Unemployment: {self.us.unemployment:.1f}%", unemp_color),
-            ("inflation", f"Inflation: {self.us.inflation:.1f}%", infl_color),
+            ("growth", "Growth: %.1f%%" % (self.us.growth * 100), growth_color),
+            ("unemployment", "Unemployment: %.1f%%" % self.us.unemployment, unemp_color),
+            ("inflation", "Inflation: %.1f%%" % self.us.inflation, infl_color),
         ]:
-            lbl = Label(
-                text,
-                x=stats_x,
-                y=cursor_y,
-                font=Fonts.NORMAL,
-                color=color,
-                max_width=stat_w,
+            lbl = self._set_label(
+                key, text, stats_x, cursor_y, color, stat_w, self.stats_panel
             )
-            self.labels[key] = lbl
-            self.labels[key]._parent = self.stats_panel
             cursor_y += lbl.height + line_gap
 
         # Approval ratings
@@ -2030,28 +2625,26 @@ class GameScreen:
             )
         )
 
-        lbl = Label(
-            f"President: {self.us.opinion.approval_president:.1f}%",
-            x=stats_x,
-            y=cursor_y,
-            font=Fonts.NORMAL,
-            color=pres_approval_color,
-            max_width=stat_w,
+        lbl = self._set_label(
+            "pres_approval",
+            "President: %.1f%%" % self.us.opinion.approval_president,
+            stats_x,
+            cursor_y,
+            pres_approval_color,
+            stat_w,
+            self.stats_panel,
         )
-        self.labels["pres_approval"] = lbl
-        self.labels["pres_approval"]._parent = self.stats_panel
         cursor_y += lbl.height + line_gap
 
-        lbl = Label(
-            f"Congress: {self.us.opinion.approval_congress:.1f}%",
-            x=stats_x,
-            y=cursor_y,
-            font=Fonts.NORMAL,
-            color=cong_approval_color,
-            max_width=stat_w,
+        lbl = self._set_label(
+            "cong_approval",
+            "Congress: %.1f%%" % self.us.opinion.approval_congress,
+            stats_x,
+            cursor_y,
+            cong_approval_color,
+            stat_w,
+            self.stats_panel,
         )
-        self.labels["cong_approval"] = lbl
-        self.labels["cong_approval"]._parent = self.stats_panel
         cursor_y += lbl.height + line_gap
 
         # Budget line
@@ -2061,16 +2654,16 @@ class GameScreen:
             if deficit < 0
             else Colors.ERROR if deficit > 800 else Colors.WARNING
         )
-        lbl = Label(
-            f"Budget: Rev ${self.us.budget.revenue:.0f}B | Spend ${self.us.budget.spending:.0f}B | Deficit ${deficit:.0f}B",
-            x=stats_x,
-            y=cursor_y,
-            font=Fonts.NORMAL,
-            color=budget_color,
-            max_width=stat_w,
+        lbl = self._set_label(
+            "budget",
+            "Budget: Rev $%.0fB | Spend $%.0fB | Deficit $%.0fB"
+            % (self.us.budget.revenue, self.us.budget.spending, deficit),
+            stats_x,
+            cursor_y,
+            budget_color,
+            stat_w,
+            self.stats_panel,
         )
-        self.labels["budget"] = lbl
-        self.labels["budget"]._parent = self.stats_panel
         cursor_y += lbl.height + line_gap
 
         # Set content height for stats panel based on stacked labels
@@ -2085,80 +2678,121 @@ class GameScreen:
 
         # Lay out state labels vertically using measured heights to avoid overlap
         current_state_y = states_y
-        for i, name in enumerate(list(self.us.states.keys())[:8]):
-            st = self.us.states[name]
+        states = self.us.states
+        for i, name in enumerate(self.us.key_state_names):
+            st = states[name]
+            st_gdp = states.gdp[i]
+            st_unemp = states.unemployment[i]
             state_label_key = f"state_{i}"
 
-            gdp_color = Colors.SUCCESS if st.gdp > 2000 else Colors.TEXT_DARK
+            gdp_color = Colors.SUCCESS if st_gdp > 2000 else Colors.TEXT_DARK
             unemp_color = (
                 Colors.SUCCESS
-                if st.unemployment < 5.0
-                else Colors.ERROR if st.unemployment > 7.0 else Colors.WARNING
+                if st_unemp < 5.0
+                else Colors.ERROR if st_unemp > 7.0 else Colors.WARNING
             )
 
-            lbl = Label(
-                f"{name}: GDP ${st.gdp:.0f}B | Unemp {st.unemployment:.1f}% | Gov: {st.governor_party.value}",
-                x=states_x,
-                y=current_state_y,
-                font=Fonts.NORMAL,
-                color=Colors.TEXT_DARK,
-                max_width=self.states_panel.content_rect.width - PADDING,
+            lbl = self._set_label(
+                state_label_key,
+                "%s: GDP $%.0fB | Unemp %.1f%% | Gov: %s"
+                % (name, st_gdp, st_unemp, st.governor_party.value),
+                states_x,
+                current_state_y,
+                Colors.TEXT_DARK,
+                self.states_panel.content_rect.width - PADDING,
+                self.states_panel,
             )
-            self.labels[state_label_key] = lbl
-            self.labels[state_label_key]._parent = self.states_panel
             current_state_y += lbl.height + 6
-        # Compute content height for states panel (stacked entries)
-        total_states_h = 0
-        for k in [k for k in self.labels.keys() if k.startswith("state_")]:
-            total_states_h += self.labels[k].height
+        # Content height for states panel (stacked entries)
+        total_states_h = current_state_y - states_y
         self.states_panel.set_content_height(
             max(self.states_panel.content_rect.height, total_states_h + PADDING)
         )
 
         # Update log with recent events
-        recent_logs = self.us.log[-12:] if self.us.log else ["No events yet."]
-        self.log_text = "\n".join(recent_logs)
-        # Estimate log content height and set scrollable height
-        # Render a temporary log_label to measure height
-        temp_log = Label(
-            self.log_text,
-            x=0,
-            y=0,
-            font=Fonts.SMALL,
-            max_width=self.log_panel.content_rect.width - PADDING,
-        )
+        if log_tail != self._log_tail:
+            self._log_tail = log_tail
+            self.log_text = self._join_log(log_tail)
+        # The rendered log label's height sets the scrollable height
+        log_h = self._sync_log_label().height
         self.log_panel.set_content_height(
-            max(self.log_panel.content_rect.height, temp_log.height + PADDING)
+            max(self.log_panel.content_rect.height, log_h + PADDING)
         )
 
-    def handle_events(self) -> None:
-        """Process pygame events"""
+    def _set_label(
+        self,
+        key: str,
+        text: str,
+        x: int,
+        y: int,
+        color: Tuple,
+        max_width: int,
+        parent: Panel,
+    ) -> Label:
+        """Show text in the panel label stored under key.
+
+        Existing labels are updated in place; update_text only re-renders
+        when the text, color or layout actually changed.
+        """
+        lbl = self.labels.get(key)
+        if lbl is None:
+            lbl = Label(
+                text, x=x, y=y, font=Fonts.NORMAL, color=color, max_width=max_width
+            )
+            lbl._parent = parent
+            self.labels[key] = lbl
+        else:
+            lbl.x = x
+            lbl.y = y
+            lbl.color = color
+            lbl.max_width = max_width
+            lbl.update_text(text)
+        return lbl
+
+    def _sync_log_label(self) -> Label:
+        """Return the log label, rebuilt only when the log text or the log
+        panel's geometry has changed"""
+        log_key = (self.log_text, tuple(self.log_panel.content_rect))
+        if log_key != self._log_label_key:
+            self._log_label = Label(
+                self.log_text,
+                x=self.log_panel.content_rect.x,
+                y=self.log_panel.content_rect.y,
+                font=Fonts.SMALL,
+                color=Colors.TEXT_DARK,
+                max_width=self.log_panel.content_rect.width - PADDING,
+            )
+            self._log_label_key = log_key
+        return self._log_label
+
+    def handle_events(self, events: Optional[List[pygame.event.Event]] = None) -> None:
+        """Process the given events, or everything queued when none are given"""
+        if events is None:
+            events = pygame.event.get()
         mouse_pos = pygame.mouse.get_pos()
 
-        # Update all buttons
-        for button in self.buttons.values():
-            button.update(mouse_pos)
-            
-        # Create a list of all interactive panels
-        all_panels = [
-            self.header_panel,
-            self.stats_panel,
-            self.states_panel,
-            self.controls_panel,
-            self.log_panel
-        ]
+        # Update all buttons; hover can't change while the pointer and the
+        # buttons stay put
+        if mouse_pos != self._last_mouse_pos:
+            self._last_mouse_pos = mouse_pos
+            update_hover(self.buttons.values(), mouse_pos)
+
+        for event in events:
+            # Pointer input only changes state the widgets track themselves:
+            # button hover and press, scroll targets, and panel geometry
+            # (checked below). Anything else repaints the whole window
+            if event.type not in POINTER_EVENT_TYPES:
+                self._dirty = True
 
-        for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
                 
             elif event.type == pygame.VIDEORESIZE:
-                # Handle window resize
-                global SCREEN_WIDTH, SCREEN_HEIGHT, screen
-                SCREEN_WIDTH, SCREEN_HEIGHT = event.size
-                screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
-                self._update_layout()
+                # Resizes arrive in bursts while the window is dragged; only
+                # the last size is laid out once it has settled
+                self._pending_resize = event.size
+                self._last_resize_t = time.perf_counter()
 
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
@@ -2177,9 +2811,14 @@ class GameScreen:
             # Handle panel interactions (dragging, resizing) first
             # Process panels in reverse draw order so top panels get events first
             event_handled = False
-            for panel in reversed(all_panels):
+            for panel in self._panels_topmost_first:
+                rect_before = tuple(panel.rect)
                 if panel.handle_event(event):
                     event_handled = True
+                    # Moved or resized panels need a full repaint; scrolling
+                    # only animates and is redrawn incrementally
+                    if tuple(panel.rect) != rect_before:
+                        self._dirty = True
                     break
                     
             # If event was not handled by a panel, pass to other UI elements
@@ -2191,93 +2830,157 @@ class GameScreen:
             # Forward wheel events to scroll panels (always process these)
             if event.type == pygame.MOUSEWHEEL:
                 # Find which panel is under the mouse for scrolling
-                mouse_pos = pygame.mouse.get_pos()
-                for panel in [self.stats_panel, self.states_panel, self.log_panel]:
-                    if panel.rect.collidepoint(mouse_pos) and hasattr(panel, 'handle_scroll'):
+                for panel in self._scroll_panels:
+                    if panel.rect.collidepoint(mouse_pos):
                         panel.handle_event(event)
                         break
 
+        self._apply_pending_resize()
+
+    def _apply_pending_resize(self) -> None:
+        """Resize and relayout once the window size has settled"""
+        if (
+            self._pending_resize
+            and time.perf_counter() - self._last_resize_t >= RESIZE_SETTLE_S
+        ):
+            if resize_display(self._pending_resize):
+                self._update_layout()
+                self._dirty = True
+            self._pending_resize = None
+
     def draw(self) -> None:
-        """Render the game screen"""
+        """Render the game screen.
+
+        Input and simulation changes repaint and present the whole window;
+        otherwise only what changes by itself is repainted, see
+        draw_incremental.
+        """
+        if self._dirty:
+            self.draw_full()
+        else:
+            self.draw_incremental()
+
+    def draw_full(self) -> None:
+        """Repaint and present the whole window"""
+        self._dirty = False
+        self._paint(self._make_info_panel())
+        present(full=True)
+
+    def draw_incremental(self) -> None:
+        """Repaint only animating scroll panels, the fading info message and
+        buttons whose hover or press state changed, and present those rects"""
+        info_panel = self._make_info_panel()
+        # Sampled before painting, which advances the animations
+        regions = [
+            panel.rect
+            for panel in self._scroll_panels
+            if panel.visible and panel.is_animating()
+        ]
+        if info_panel is not None:
+            regions.append(info_panel.chrome_rect())
+        if regions:
+            # A dirty button the repaint would only partly cover is repainted
+            # whole with it, so no part of it keeps its old hover/press state
+            area = regions[0].unionall(regions[1:])
+            pending = [b for b in self.buttons.values() if b._dirty]
+            grown = True
+            while grown:
+                grown = False
+                for button in pending:
+                    if button.rect.colliderect(area) and not area.contains(button.rect):
+                        area.union_ip(button.rect)
+                        regions.append(button.rect)
+                        grown = True
+            # Everything under the regions is repainted from the background
+            # up; the clip keeps the rest of the window untouched
+            screen.set_clip(area)
+            self._paint(info_panel)
+            screen.set_clip(None)
+            for region in regions:
+                mark_dirty(region)
+
+        # Buttons are opaque, so the ones outside the repaint can be redrawn
+        # over themselves
+        for button in self.buttons.values():
+            if button._dirty:
+                button.draw(screen)
+        present()
+
+    def _make_info_panel(self) -> Optional[Panel]:
+        """Return the panel behind the info message, or None when none is shown"""
+        if not (self.info_msg and self.info_timer > 0):
+            return None
+        panel = self._info_panel
+        panel.rect.topleft = (SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT - 70)
+        # The chrome is only re-rendered when the alpha actually changes,
+        # i.e. while the message fades out
+        panel.bg_color = (50, 50, 60, min(200, self.info_timer * 2))
+        return panel
+
+    def _paint(self, info_panel: Optional[Panel]) -> None:
+        """Paint the whole scene, restricted to the screen's current clip"""
         # Fill background
         screen.fill(Colors.BG_LIGHT)
 
-        # Draw panels
-        self.header_panel.draw(screen)
-        self.stats_panel.draw(screen)
-        self.states_panel.draw(screen)
-        self.controls_panel.draw(screen)
-        self.log_panel.draw(screen)
+        # Draw panels: the cached chrome goes out in one batch, then the
+        # scrollbars on top
+        panels = [panel for panel in self._panels if panel.visible]
+        blit_all(screen, [panel.chrome_blit() for panel in panels])
+        for panel in panels:
+            panel.draw_overlay(screen)
 
         # Draw header
         self.header_label.draw(screen)
 
-        # Draw all labels
-        # Draw labels, handling scroll offsets for panels
-        # Header/stats/controls labels are drawn normally
-        for k, label in self.labels.items():
+        # Draw labels, one batch per panel: each batch is clipped to the
+        # panel's content and shifted by its scroll offset. Labels without a
+        # panel are drawn normally
+        batches: Dict[Panel, List[Tuple[pygame.Surface, Tuple[int, int]]]] = {}
+        for label in self.labels.values():
             parent = getattr(label, "_parent", None)
-            if parent is not None and isinstance(parent, Panel):
-                prev_clip = screen.get_clip()
-                screen.set_clip(parent.content_rect)
-
-                # If parent is a ScrollPanel, apply vertical scroll offset
-                scroll_y = parent.scroll_y if hasattr(parent, "scroll_y") else 0
-                for surf, rect in label._rendered_lines:
-                    surf_rect = rect.copy()
-                    surf_rect.top -= scroll_y
-                    screen.blit(surf, surf_rect)
-
-                screen.set_clip(prev_clip)
+            if isinstance(parent, Panel):
+                batches.setdefault(parent, []).extend(label.get_blits())
             else:
                 label.draw(screen)
+        # Log text inside log_panel
+        batches.setdefault(self.log_panel, []).extend(self._sync_log_label().get_blits())
+        prev_clip = screen.get_clip()
+        for panel, pairs in batches.items():
+            scroll_y = getattr(panel, "scroll_y", 0)
+            clip = panel.content_rect.clip(prev_clip)
+            screen.set_clip(clip)
+            # Labels are pre-rendered, so scrolling only shifts them; those
+            # entirely outside the visible window are not blitted at all
+            blit_all(
+                screen,
+                [
+                    (surf, (x, y - scroll_y))
+                    for surf, (x, y) in pairs
+                    if clip.top < y - scroll_y + surf.get_height()
+                    and y - scroll_y < clip.bottom
+                ],
+            )
+        screen.set_clip(prev_clip)
 
         # Draw buttons
         for button in self.buttons.values():
             button.draw(screen)
 
-        # Draw log text inside log_panel with scroll offset
-        log_x = self.log_panel.content_rect.x
-        log_y = self.log_panel.content_rect.y
-        log_label = Label(
-            self.log_text,
-            x=log_x,
-            y=log_y,
-            font=Fonts.SMALL,
-            color=Colors.TEXT_DARK,
-            max_width=self.log_panel.content_rect.width - PADDING,
-        )
-        prev_clip = screen.get_clip()
-        screen.set_clip(self.log_panel.content_rect)
-        for surf, rect in log_label._rendered_lines:
-            surf_rect = rect.copy()
-            surf_rect.top -= self.log_panel.scroll_y
-            screen.blit(surf, surf_rect)
-        screen.set_clip(prev_clip)
-
         # Draw info message if active
-        if self.info_msg and self.info_timer > 0:
-            info_panel = Panel(
-                rect=pygame.Rect(SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT - 70, 400, 50),
-                bg_color=(50, 50, 60, min(200, self.info_timer * 2)),
-                border_color=None,
-                corner_radius=CORNER_RADIUS,
-            )
+        if info_panel is not None:
             info_panel.draw(screen)
 
-            info_label = Label(
-                self.info_msg,
-                x=SCREEN_WIDTH // 2,
-                y=SCREEN_HEIGHT - 45,
-                font=Fonts.NORMAL,
-                color=self.info_color,
-                align="center",
-            )
+            info_label = self._info_label
+            info_label.x = SCREEN_WIDTH // 2
+            info_label.y = SCREEN_HEIGHT - 45
+            info_label.color = self.info_color
+            info_label.update_text(self.info_msg)
             info_label.draw(screen)
 
             self.info_timer -= 1
-
-        pygame.display.flip()
+            if self.info_timer <= 0:
+                # Repaint once more to clear the message
+                self._dirty = True
 
     def run(self) -> None:
         """Main game loop"""
@@ -2286,11 +2989,35 @@ class GameScreen:
         # Initial UI update
         self.update_ui()
 
+        _allow_game_events()
         self.running = True
+        events: Optional[List[pygame.event.Event]] = None
         while self.running:
-            self.handle_events()
-            self.draw()
-            clock.tick(FRAME_RATE)
+            self.handle_events(events)
+            events = None
+            if (
+                self._dirty
+                or self._is_animating()
+                or any(button._dirty for button in self.buttons.values())
+            ):
+                self.draw()
+                clock.tick(FRAME_RATE)
+            else:
+                # Nothing to redraw: sleep until input arrives instead of
+                # repainting the unchanged screen at FRAME_RATE
+                event = pygame.event.wait(
+                    int(RESIZE_SETTLE_S * 1000) if self._pending_resize else IDLE_WAIT_MS
+                )
+                if event.type != pygame.NOEVENT:
+                    # Handled first on the next pass, ahead of whatever
+                    # queued up behind it (re-posting would reorder them)
+                    events = [event] + pygame.event.get()
+
+    def _is_animating(self) -> bool:
+        """Return True while something on screen changes without input"""
+        if self.info_msg and self.info_timer > 0:
+            return True
+        return any(panel.is_animating() for panel in self._scroll_panels)
 
 
 # Run the main menu when this file is executed directly
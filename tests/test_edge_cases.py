@@ -1,6 +1,10 @@
+import json
+import os
 import random
+import tempfile
 import unittest
 
+from usa.config import ConfigLoader
 from usa.models import District, Event, EventManager, PartyID, Policy, UnitedStates
 
 
@@ -102,6 +106,57 @@ class EdgeCaseTest(unittest.TestCase):
         # The follow-up event should be scheduled with delay
         self.assertIn(("x", 3), em.pending_events)
 
+    def test_states_table_columns_track_state_objects(self):
+        us = UnitedStates.new_default(seed=3)
+        i = us.states.index("Texas")
+        st = us.states["Texas"]
+        st.gdp = 1234.0
+        self.assertEqual(us.states.gdp[i], 1234.0)
+        us.advance_turn(1)
+        self.assertEqual(st.gdp, us.states.gdp[i])
+        # A removed state keeps its values and no longer follows the table
+        popped = us.states.pop("Texas")
+        gdp = popped.gdp
+        us.states.gdp[:] = 0.0
+        self.assertEqual(popped.gdp, gdp)
+        self.assertNotIn("Texas", us.states.names)
+        self.assertEqual(len(us.states.gdp), len(us.states))
+
+    def test_config_cache_picks_up_json_edits(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "policies.json")
+
+            def write(title, mtime):
+                with open(path, "w") as f:
+                    json.dump(
+                        {"policies": [{"key": "p", "title": title, "description": ""}]},
+                        f,
+                    )
+                os.utime(path, (mtime, mtime))
+
+            write("First", 1_000_000)
+            self.assertEqual(ConfigLoader(d).get_policy("p").title, "First")
+            self.assertTrue(os.path.exists(os.path.join(d, ".cache")))
+            self.assertEqual(ConfigLoader(d).get_policy("p").title, "First")
+            write("Second", 2_000_000)
+            self.assertEqual(ConfigLoader(d).get_policy("p").title, "Second")
+
+    def test_config_corrupt_cache_falls_back_to_json(self):
+        with tempfile.TemporaryDirectory() as d:
+            with open(os.path.join(d, "policies.json"), "w") as f:
+                json.dump({"policies": [{"key": "p", "title": "Fresh", "description": ""}]}, f)
+            cache_path = os.path.join(d, ".cache", "configloader.pkl")
+            os.makedirs(os.path.dirname(cache_path))
+            with open(cache_path, "wb") as f:
+                f.write(b"\x80\x09garbage")
+            self.assertEqual(ConfigLoader(d).get_policy("p").title, "Fresh")
+
+    def test_load_rejects_unknown_shock_bit_generator(self):
+        data = UnitedStates.new_default(seed=4).to_dict()
+        data["shock_rng_state"]["bit_generator"] = "default_rng"
+        with self.assertRaises(ValueError):
+            UnitedStates.from_dict(data)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,9 @@
+import io
 import json
 import unittest
 
-from usa.models import PartyID, UnitedStates
+from usa.experiment import sweep
+from usa.models import LOG_MAXLEN, PartyID, UnitedStates
 
 
 class SmokeTest(unittest.TestCase):
@@ -11,6 +13,26 @@ class SmokeTest(unittest.TestCase):
         us.advance_turn(3)
         self.assertTrue((us.year, us.month) != (y0, m0))
 
+    def test_advance_turn_returns_monthly_reports(self):
+        us = UnitedStates.new_default(seed=4)
+        n0 = len(us.log)
+        y0, m0 = us.year, us.month
+        reports = us.advance_turn(3)
+        self.assertEqual(len(reports), 3)
+        self.assertEqual((reports[0].year, reports[0].month), (y0, m0))
+        self.assertEqual(sum((r.log for r in reports), []), list(us.log)[n0:])
+        for r in reports:
+            for title in r.policies:
+                self.assertTrue(any(title.split(": ")[-1] in e for e in r.log))
+
+    def test_log_is_bounded(self):
+        us = UnitedStates.new_default(seed=6)
+        for i in range(LOG_MAXLEN + 10):
+            us.log_event(f"entry {i}")
+        self.assertEqual(len(us.log), LOG_MAXLEN)
+        self.assertEqual(us.tail_log(2), [us.log[-2], us.log[-1]])
+        self.assertTrue(us.tail_log(1)[0].endswith(f"entry {LOG_MAXLEN + 9}"))
+
     def test_election_and_policy_paths(self):
         us = UnitedStates.new_default(seed=2)
         us.month = 10
@@ -31,6 +53,20 @@ class SmokeTest(unittest.TestCase):
         self.assertAlmostEqual(us2.growth, us.growth, places=6)
         self.assertEqual(set(us2.states.keys()), set(us.states.keys()))
 
+    def test_write_snapshot_lists_states_and_log(self):
+        us = UnitedStates.new_default(seed=5)
+        us.advance_turn(2)
+        buf = io.StringIO()
+        us.write_snapshot(buf, last_logs=3)
+        text = buf.getvalue()
+        for name in us.states:
+            self.assertIn(f"  {name}: ", text)
+        for entry in us.tail_log(3):
+            self.assertIn(entry, text)
+        # The streamed text and snapshot_lines() come from the same formatter
+        self.assertEqual(text, "".join(f"{line}\n" for line in us.snapshot_lines(3)))
+        self.assertIn(f"Date: {us.year}-{us.month:02d}\n", text)
+
     def test_deterministic_continuation(self):
         # With saved rng state, continuing should match a control run
         us_a = UnitedStates.new_default(seed=1234)
@@ -47,6 +83,13 @@ class SmokeTest(unittest.TestCase):
         self.assertAlmostEqual(us_a.unemployment, us_b.unemployment, places=6)
         self.assertAlmostEqual(us_a.inflation, us_b.inflation, places=6)
 
+    def test_sweep_matches_sequential_runs(self):
+        snaps = sweep([3, 8], turns=4, processes=2)
+        for seed, snap in zip([3, 8], snaps):
+            us = UnitedStates.new_default(seed=seed)
+            us.advance_turn(4)
+            self.assertEqual(snap, us.snapshot())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,31 @@
+"""Ahead-of-time build of the simulation kernels.
+
+Compiles the functions in ``usa._kernels_py`` into the ``usa._kernels``
+extension module with numba's AOT compiler, so one-shot runs (such as
+``cli.py``) load machine code instead of JIT-compiling on every start::
+
+    python -m usa._kernels_build
+
+``usa.models`` prefers the built module and falls back to JIT (or plain
+Python) when it is missing. Rebuild after changing ``_kernels_py.py``.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from usa._kernels_py import advance_step
+
+cc = CC("_kernels", source_module="usa._kernels_py")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.verbose = False
+
+cc.export(
+    "advance_step",
+    "UniTuple(f8, 3)(f8, f8, f8, f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:],"
+    " f8[:, :])",
+)(advance_step)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,47 @@
+"""Numeric simulation kernels in plain Python.
+
+These are the reference implementations. ``usa.models`` JIT-compiles them with
+numba when it is available, and ``usa._kernels_build`` compiles them ahead of
+time into ``usa._kernels``. Keep them to the numba-supported subset of Python.
+"""
+
+
+def advance_step(
+    growth,
+    unemployment,
+    inflation,
+    macro_shocks,
+    state_gdp,
+    state_unemployment,
+    state_inflation,
+    state_tax_rate,
+    state_revenue,
+    state_spending,
+    state_shocks,
+):
+    """Apply one month of macro drift and state economic ticks.
+
+    State arrays are updated in place; the new national (growth, unemployment,
+    inflation) is returned. ``macro_shocks`` holds the growth, inflation and
+    unemployment drift; each row of ``state_shocks`` holds the GDP,
+    unemployment, inflation and spending noise for one state.
+    """
+    growth = max(-0.05, min(0.06, growth + macro_shocks[0]))
+    inflation = max(0.0, min(10.0, inflation + macro_shocks[1]))
+    unemployment = max(2.5, min(20.0, unemployment + macro_shocks[2]))
+    target_u = 5.5 - 0.5 * growth
+    for i in range(state_gdp.shape[0]):
+        gdp_growth = max(-0.1, min(0.1, growth + state_shocks[i, 0]))
+        state_gdp[i] *= 1.0 + gdp_growth
+        u = state_unemployment[i]
+        u += 0.2 * (target_u - u) + state_shocks[i, 1]
+        state_unemployment[i] = max(2.5, min(20.0, u))
+        state_inflation[i] = max(
+            0.0, min(20.0, 0.6 * inflation + state_shocks[i, 2])
+        )
+        # spending mean-reverts toward tax revenue with small noise
+        state_revenue[i] = state_tax_rate[i] * state_gdp[i]
+        state_spending[i] += (
+            0.2 * (state_revenue[i] - state_spending[i]) + state_shocks[i, 3]
+        )
+    return growth, unemployment, inflation
@@ -2,9 +2,19 @@
 
 import json
 import os
+import pickle
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+# Bump when EventConfig/PolicyConfig change shape so stale pickles are ignored
+_CACHE_VERSION = 1
+_CACHE_FILE = os.path.join(".cache", "configloader.pkl")
+
+# Parsed configurations already loaded by this process, keyed by directory
+_loaded: Dict[
+    str, Tuple[Tuple, Dict[str, "EventConfig"], Dict[str, "PolicyConfig"]]
+] = {}
 
 
 class TriggerType(Enum):
@@ -84,9 +94,63 @@ class ConfigLoader:
         self._load_configurations()
 
     def _load_configurations(self) -> None:
-        """Load all configuration files."""
-        self._load_events()
-        self._load_policies()
+        """Load all configuration files.
+
+        Parsed results are reused within the process and pickled to
+        ``<config_dir>/.cache/`` for later runs; both are keyed by the JSON
+        files' modification times, so edits to the JSON are always picked up.
+        """
+        key = self._source_key()
+        memo_key = os.path.abspath(self.config_dir)
+        cached = _loaded.get(memo_key)
+        if cached is None or cached[0] != key:
+            cached = self._read_cache(key)
+        if cached is None:
+            self._load_events()
+            self._load_policies()
+            cached = (key, self.events, self.policies)
+            self._write_cache(cached)
+        _loaded[memo_key] = cached
+        self.events = dict(cached[1])
+        self.policies = dict(cached[2])
+
+    def _source_key(self) -> Tuple:
+        """Return the modification times of the JSON sources (None if missing)."""
+        key = [_CACHE_VERSION]
+        for name in ("events.json", "policies.json"):
+            try:
+                key.append(os.stat(os.path.join(self.config_dir, name)).st_mtime_ns)
+            except OSError:
+                key.append(None)
+        return tuple(key)
+
+    def _read_cache(self, key: Tuple) -> Optional[Tuple]:
+        cache_path = os.path.join(self.config_dir, _CACHE_FILE)
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+        except Exception:
+            # A missing, truncated, corrupt or foreign cache (unpickling can
+            # raise nearly anything) just means the JSON is parsed again
+            return None
+        if not isinstance(cached, tuple) or len(cached) != 3 or cached[0] != key:
+            return None
+        return cached
+
+    def _write_cache(self, cached: Tuple) -> None:
+        # Nothing to cache when there is no config directory at all
+        if not os.path.isdir(self.config_dir):
+            return
+        cache_path = os.path.join(self.config_dir, _CACHE_FILE)
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # A read-only checkout just means no on-disk cache
+            pass
 
     def _load_events(self) -> None:
         """Load event configurations from JSON."""
@@ -0,0 +1,30 @@
+"""Multi-seed experiment helpers."""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .models import UnitedStates
+
+
+def _run_one(args: Tuple[int, int]) -> Dict[str, object]:
+    seed, turns = args
+    us = UnitedStates.new_default(seed=seed)
+    us.advance_turn(turns)
+    return us.snapshot()
+
+
+def sweep(
+    seeds: Iterable[int], turns: int, processes: Optional[int] = None
+) -> List[Dict[str, object]]:
+    """Run one simulation per seed for `turns` months and return their snapshots.
+
+    Runs are independent, so they are spread over a process pool (`processes`
+    defaults to the CPU count). Snapshots come back in the order of `seeds`.
+    """
+    jobs = [(seed, turns) for seed in seeds]
+    if not jobs:
+        return []
+    with mp.Pool(processes=processes) as pool:
+        return pool.map(_run_one, jobs)
@@ -22,7 +22,7 @@ def run(months: int, seed: Optional[int]) -> None:
     )
     if us.log:
         print("Recent log:")
-        for line in us.log[-10:]:
+        for line in us.tail_log(10):
             print(" -", line)
 
 
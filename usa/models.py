@@ -1,10 +1,54 @@
 from __future__ import annotations
 
 import copy
+import os
 import random
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import islice
+from typing import (
+    IO,
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+
+from ._kernels_py import advance_step as _py_advance_step
+
+# Numba is optional. Kernels come from the ahead-of-time build in usa._kernels
+# when it exists (see usa/_kernels_build.py), else are JIT-compiled on first
+# use. Without numba, or with NUMBA_DISABLE_JIT=1, they run as plain Python.
+_JIT_DISABLED = os.environ.get("NUMBA_DISABLE_JIT", "0") not in ("", "0")
+if _JIT_DISABLED:
+    _numba = None
+else:
+    try:
+        import numba as _numba
+    except ImportError:
+        _numba = None
+
+
+def _njit(fn):
+    return _numba.njit(cache=True)(fn) if _numba is not None else fn
+
+
+_advance_step = None
+if not _JIT_DISABLED:
+    try:
+        from ._kernels import advance_step as _advance_step
+    except ImportError:
+        pass
+if _advance_step is None:
+    _advance_step = _njit(_py_advance_step)
 
 
 def _enum_value(e):
@@ -30,6 +74,15 @@ def _listify(obj):
     return obj
 
 
+# Uniform bounds of the monthly economic shocks fed to _advance_step:
+# macro (growth, inflation, unemployment drift) and per state
+# (GDP growth, unemployment, inflation, spending noise).
+_MACRO_SHOCK_LOW = np.array([-0.002, -0.05, -0.05])
+_MACRO_SHOCK_HIGH = -_MACRO_SHOCK_LOW
+_STATE_SHOCK_LOW = np.array([-0.01, -0.1, -0.2, -1.0])
+_STATE_SHOCK_HIGH = -_STATE_SHOCK_LOW
+
+
 class Branch(Enum):
     EXECUTIVE = auto()
     LEGISLATIVE = auto()
@@ -201,21 +254,57 @@ class District:
         )
 
 
+_NO_DEFAULT = object()
+
+
+class _Column:
+    """Numeric State field stored in a StatesTable column while attached.
+
+    A detached State keeps the value in its own ``__dict__``; once added to a
+    StatesTable, reads and writes go to ``table.<field>[index]`` instead.
+    """
+
+    def __init__(self, default: Any = _NO_DEFAULT) -> None:
+        self.default = default
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        if obj is None:
+            # dataclass reads the class attribute to find the field default
+            if self.default is _NO_DEFAULT:
+                raise AttributeError(self.name)
+            return self.default
+        table = obj.__dict__.get("_table")
+        if table is not None:
+            return float(getattr(table, self.name)[obj.__dict__["_index"]])
+        return obj.__dict__[self.name]
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        table = obj.__dict__.get("_table")
+        if table is not None:
+            getattr(table, self.name)[obj.__dict__["_index"]] = value
+        else:
+            obj.__dict__[self.name] = value
+
+
 @dataclass
 class State:
     name: str
     population: int
-    gdp: float  # in billions
-    unemployment: float  # %
-    inflation: float  # %
+    gdp: float = _Column()  # in billions
+    unemployment: float = _Column()  # %
+    inflation: float = _Column()  # %
     governor_party: PartyID
     legislature: LegislatureControl
     approval_governor: float = 50.0
     approval_legislature: float = 40.0
     # simple public finance placeholders
-    budget_revenue: float = 100.0  # billions
-    budget_spending: float = 100.0  # billions
-    tax_rate: float = 0.06  # effective state-level tax rate over GDP (approx.)
+    budget_revenue: float = _Column(100.0)  # billions
+    budget_spending: float = _Column(100.0)  # billions
+    # effective state-level tax rate over GDP (approx.)
+    tax_rate: float = _Column(0.06)
     gdp_sectors: Dict[str, float] = field(
         default_factory=lambda: {
             "services": 0.65,
@@ -241,25 +330,6 @@ class State:
         0.0  # typical range ~[-0.05, 0.05]; adds small turnout-driven tilt
     )
 
-    # Simple state economy tick
-    def advance_economy(
-        self, growth: float, nat_inflation: float, rng: random.Random
-    ) -> None:
-        gdp_growth = max(
-            -0.1, min(0.1, growth + rng.uniform(-0.01, 0.01))
-        )  # +/- 1pp noise
-        self.gdp *= 1.0 + gdp_growth
-        # unemployment mean-reverts to 5-6% with noise and growth sensitivity
-        target_u = 5.5 - 0.5 * growth
-        self.unemployment += 0.2 * (target_u - self.unemployment) + rng.uniform(
-            -0.1, 0.1
-        )
-        self.unemployment = max(2.5, min(20.0, self.unemployment))
-        # inflation partially driven by national inflation
-        self.inflation = max(
-            0.0, min(20.0, 0.6 * nat_inflation + rng.uniform(-0.2, 0.2))
-        )
-
     def to_dict(self) -> Dict[str, object]:
         return {
             "name": self.name,
@@ -318,6 +388,104 @@ class State:
         return st
 
 
+class StatesTable(MutableMapping[str, State]):
+    """Name -> State mapping whose numeric economy fields live in NumPy columns.
+
+    Each column (``gdp``, ``unemployment``, ...) is a float64 array indexed by
+    the state's position in ``names``, so monthly updates can run over all
+    states at once. The State objects remain usable as before; their numeric
+    attributes read and write the table.
+    """
+
+    COLUMNS = (
+        "gdp",
+        "unemployment",
+        "inflation",
+        "budget_revenue",
+        "budget_spending",
+        "tax_rate",
+    )
+
+    def __init__(self, states: Optional[Iterable[Tuple[str, State]]] = None) -> None:
+        self.names: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._states: List[State] = []
+        # key_names() results, dropped whenever states are added or removed
+        self._key_names: Dict[int, Tuple[str, ...]] = {}
+        for col in self.COLUMNS:
+            setattr(self, col, np.zeros(0, dtype=np.float64))
+        if states is not None:
+            items = states.items() if isinstance(states, dict) else states
+            for name, st in items:
+                self[name] = st
+
+    def index(self, name: str) -> int:
+        return self._index[name]
+
+    def key_names(self, n: int) -> Tuple[str, ...]:
+        """Return the first ``n`` state names (their indices are 0..n-1)."""
+        names = self._key_names.get(n)
+        if names is None:
+            names = self._key_names[n] = tuple(self.names[:n])
+        return names
+
+    def _bind(self, st: State, i: int) -> None:
+        owner = st.__dict__.get("_table")
+        if owner is not None:
+            owner._detach(st)
+        for col in self.COLUMNS:
+            getattr(self, col)[i] = st.__dict__.pop(col)
+        st.__dict__["_table"] = self
+        st.__dict__["_index"] = i
+
+    def _detach(self, st: State) -> None:
+        for col in self.COLUMNS:
+            st.__dict__[col] = float(getattr(self, col)[st.__dict__["_index"]])
+        st.__dict__["_table"] = None
+        st.__dict__["_index"] = None
+
+    def __getitem__(self, name: str) -> State:
+        return self._states[self._index[name]]
+
+    def __setitem__(self, name: str, st: State) -> None:
+        i = self._index.get(name)
+        if i is None:
+            i = len(self.names)
+            self._key_names.clear()
+            self.names.append(name)
+            self._index[name] = i
+            self._states.append(st)
+            for col in self.COLUMNS:
+                setattr(self, col, np.append(getattr(self, col), 0.0))
+        else:
+            old = self._states[i]
+            if old is not st:
+                self._detach(old)
+            self._states[i] = st
+        self._bind(st, i)
+
+    def __delitem__(self, name: str) -> None:
+        i = self._index.pop(name)
+        self._key_names.clear()
+        self._detach(self._states[i])
+        del self.names[i]
+        del self._states[i]
+        for col in self.COLUMNS:
+            setattr(self, col, np.delete(getattr(self, col), i))
+        for j in range(i, len(self.names)):
+            self._index[self.names[j]] = j
+            self._states[j].__dict__["_index"] = j
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.names))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"StatesTable({self.names!r})"
+
+
 @dataclass
 class FederalBudget:
     revenue: float  # billions
@@ -513,17 +681,49 @@ class EventManager:
 
     def __init__(self, rng: random.Random):
         self.rng = rng
-        self.catalog: Dict[str, Tuple[Event, float]] = {}
+        self._catalog: Dict[str, Tuple[Event, float]] = {}
         self.pending_events: List[Tuple[str, int]] = []  # (event_key, delay_months)
 
-        # Load configuration
+        # Configuration is loaded on first use of `catalog` or `config_loader`
+        self._config_loaded = False
+        self._config_loader = None
+
+    def _ensure_config(self) -> None:
+        """Load configured events once, ahead of any events registered so far."""
+        if self._config_loaded:
+            return
+        self._config_loaded = True
+        registered = self._catalog
+        self._catalog = {}
         try:
             from .config import ConfigLoader
 
-            self.config_loader = ConfigLoader()
+            self._config_loader = ConfigLoader()
             self._load_events_from_config()
         except ImportError:
-            self.config_loader = None
+            self._config_loader = None
+        # Same key order and overrides as registering after an eager load
+        self._catalog.update(registered)
+
+    @property
+    def config_loader(self):
+        self._ensure_config()
+        return self._config_loader
+
+    @config_loader.setter
+    def config_loader(self, value) -> None:
+        self._config_loaded = True
+        self._config_loader = value
+
+    @property
+    def catalog(self) -> Dict[str, Tuple[Event, float]]:
+        self._ensure_config()
+        return self._catalog
+
+    @catalog.setter
+    def catalog(self, value: Dict[str, Tuple[Event, float]]) -> None:
+        self._ensure_config()
+        self._catalog = value
 
     def _load_events_from_config(self) -> None:
         """Load events from configuration files."""
@@ -557,7 +757,8 @@ class EventManager:
             self.register(event, event_config.weight)
 
     def register(self, event: Event, weight: float = 1.0) -> None:
-        self.catalog[event.key] = (event, weight)
+        # Does not force the config load; see _ensure_config for ordering
+        self._catalog[event.key] = (event, weight)
 
     def check_event_conditions(self, event_config, us: "UnitedStates") -> bool:
         """Check if an event's trigger conditions are met."""
@@ -792,6 +993,26 @@ class EventManager:
         return em
 
 
+@dataclass(slots=True)
+class TurnReport:
+    """What happened during one simulated month, as returned by `advance_turn`."""
+
+    year: int
+    month: int
+    events: List[str] = field(default_factory=list)  # names of triggered events
+    # titles of passed policies; state policies are prefixed "<State>: "
+    policies: List[str] = field(default_factory=list)
+    log: List[str] = field(default_factory=list)  # entries logged this month
+
+
+# Number of states featured in summaries such as the game screen
+KEY_STATE_COUNT = 8
+# Most recent log entries kept in UnitedStates.log; older ones are dropped
+LOG_MAXLEN = 500
+# Bit generators a saved shock_rng_state may name; to_dict only writes PCG64
+_SHOCK_BIT_GENERATORS = {"PCG64": np.random.PCG64}
+
+
 @dataclass
 class UnitedStates:
     """Top-level game state for the USA simulation.
@@ -808,22 +1029,58 @@ class UnitedStates:
     congress: Congress
     court: SupremeCourt
     parties: Dict[PartyID, PoliticalParty]
-    states: Dict[str, State]
+    states: StatesTable
     budget: FederalBudget
     opinion: PublicOpinion
     event_manager: EventManager
     rng: random.Random = field(default_factory=random.Random)
+    # continuous economic shocks are drawn in bulk from a NumPy generator;
+    # `rng` stays the source for discrete AI/event/election decisions
+    shock_rng: np.random.Generator = field(
+        default_factory=np.random.default_rng, repr=False, compare=False
+    )
 
     # macro indicators (annualized rates, but we'll tick monthly/quarterly)
     growth: float = 0.02
     unemployment: float = 5.5
     inflation: float = 2.5
 
-    log: List[str] = field(default_factory=list)
+    log: Deque[str] = field(default_factory=lambda: deque(maxlen=LOG_MAXLEN))
     recent_events: List[str] = field(default_factory=list)
+    # report for the month currently being advanced
+    _turn_report: Optional[TurnReport] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def key_state_names(self) -> Tuple[str, ...]:
+        """Names of the states featured in summaries (the first KEY_STATE_COUNT)."""
+        return self.states.key_names(KEY_STATE_COUNT)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # plain dicts of states are adopted into a column-backed table
+        if name == "states" and not isinstance(value, StatesTable):
+            value = StatesTable(value)
+        # lists of log entries are kept as a bounded deque
+        elif name == "log" and not (
+            isinstance(value, deque) and value.maxlen == LOG_MAXLEN
+        ):
+            value = deque(value, maxlen=LOG_MAXLEN)
+        super().__setattr__(name, value)
+
+    def tail_log(self, n: int) -> List[str]:
+        """Return the last `n` log entries, oldest first."""
+        if n <= 0:
+            return []
+        entries = list(islice(reversed(self.log), n))
+        entries.reverse()
+        return entries
 
     def log_event(self, msg: str) -> None:
-        self.log.append(f"[{self.year}-{self.month:02d}] {msg}")
+        entry = f"[{self.year}-{self.month:02d}] {msg}"
+        self.log.append(entry)
+        if self._turn_report is not None:
+            self._turn_report.log.append(entry)
 
     # --- election helpers ---
     def _init_state_elections_if_missing(self, st: State) -> None:
@@ -1150,6 +1407,8 @@ class UnitedStates:
             # National issue awareness
             self.opinion.update_issue(policy, self.rng.uniform(-2.0, 2.0))
             self.log_event(f"{st.name} policy passed: {policy.title}")
+            if self._turn_report is not None:
+                self._turn_report.policies.append(f"{st.name}: {policy.title}")
             return True
         else:
             self.log_event(f"{st.name} policy failed: {policy.title}")
@@ -1387,6 +1646,8 @@ class UnitedStates:
                     0.0, min(100.0, self.opinion.approval_president + 1.0)
                 )
             self.log_event(f"Policy passed: {policy.title}")
+            if self._turn_report is not None:
+                self._turn_report.policies.append(policy.title)
             return True
         else:
             self.log_event(f"Policy failed: {policy.title}")
@@ -1494,23 +1755,36 @@ class UnitedStates:
             min(100.0, self.opinion.approval_congress + ev.impact_approval_congress),
         )
 
-        # Apply state-specific effects
-        for state_name, effects in ev.state_effects.items():
-            state = self.states.get(state_name)
-            if state:
+        # Apply state-specific effects as whole-column updates
+        if ev.state_effects:
+            states = self.states
+            gdp_factor = np.ones(len(states))
+            unemp_delta = np.zeros(len(states))
+            unemp_mask = np.zeros(len(states), dtype=bool)
+            for state_name, effects in ev.state_effects.items():
+                if state_name not in states:
+                    continue
+                i = states.index(state_name)
                 if "impact_gdp" in effects:
-                    state.gdp *= 1.0 + effects["impact_gdp"]
+                    gdp_factor[i] = 1.0 + effects["impact_gdp"]
                 if "impact_unemployment" in effects:
-                    state.unemployment = max(
-                        2.5,
-                        min(20.0, state.unemployment + effects["impact_unemployment"]),
-                    )
+                    unemp_delta[i] = effects["impact_unemployment"]
+                    unemp_mask[i] = True
+            states.gdp *= gdp_factor
+            if unemp_mask.any():
+                states.unemployment[unemp_mask] = np.clip(
+                    states.unemployment[unemp_mask] + unemp_delta[unemp_mask],
+                    2.5,
+                    20.0,
+                )
 
         # Handle party benefit
         if ev.party_benefit and ev.party_benefit in self.parties:
             self.parties[ev.party_benefit].adjust_approval(1.0)
 
         self.log_event(f"Event: {ev.description}")
+        if self._turn_report is not None:
+            self._turn_report.events.append(ev.name or ev.description)
 
         # Process consequences
         self.event_manager.process_event_consequences(ev, self)
@@ -1522,26 +1796,37 @@ class UnitedStates:
         return ev
 
     # --- monthly/quarterly tick ---
-    def advance_turn(self, months: int = 1) -> None:
+    def advance_turn(self, months: int = 1) -> List[TurnReport]:
+        """Advance the simulation by ``months`` and return a report per month.
+
+        Only the numeric economy step runs in the kernel: every month's result
+        feeds the AI, event and election logic, which draw from the same RNG,
+        so the month loop itself stays in Python.
+        """
+        shock_rng = self.shock_rng
+        states = self.states
+        state_shape = (len(states), len(_STATE_SHOCK_LOW))
+        reports: List[TurnReport] = []
         for _ in range(months):
-            # macro drift
-            self.growth += self.rng.uniform(-0.002, 0.002)
-            self.inflation += self.rng.uniform(-0.05, 0.05)
-            self.unemployment += self.rng.uniform(-0.05, 0.05)
-            # clamp
-            self.growth = max(-0.05, min(0.06, self.growth))
-            self.inflation = max(0.0, min(10.0, self.inflation))
-            self.unemployment = max(2.5, min(20.0, self.unemployment))
-
-            # state economies
-            for st in self.states.values():
-                st.advance_economy(self.growth, self.inflation, self.rng)
-                # simplistic public finance update for states
-                st.budget_revenue = st.tax_rate * st.gdp
-                # spending mean-reverts toward revenue with small noise
-                st.budget_spending += 0.2 * (
-                    st.budget_revenue - st.budget_spending
-                ) + self.rng.uniform(-1.0, 1.0)
+            self._turn_report = TurnReport(year=self.year, month=self.month)
+            # macro drift and state economy noise, drawn as arrays
+            macro_shocks = shock_rng.uniform(_MACRO_SHOCK_LOW, _MACRO_SHOCK_HIGH)
+            state_shocks = shock_rng.uniform(
+                _STATE_SHOCK_LOW, _STATE_SHOCK_HIGH, size=state_shape
+            )
+            self.growth, self.unemployment, self.inflation = _advance_step(
+                self.growth,
+                self.unemployment,
+                self.inflation,
+                macro_shocks,
+                states.gdp,
+                states.unemployment,
+                states.inflation,
+                states.tax_rate,
+                states.budget_revenue,
+                states.budget_spending,
+                state_shocks,
+            )
 
             # AI policy consideration
             pol = self.ai_consider_policy()
@@ -1579,7 +1864,7 @@ class UnitedStates:
                 self.ai_party_national_strategy()
 
             # federal revenue tracks national GDP via tax_rate
-            total_gdp = sum(st.gdp for st in self.states.values())
+            total_gdp = float(self.states.gdp.sum())
             self.budget.revenue = self.budget.tax_rate * total_gdp
 
             # time
@@ -1588,6 +1873,10 @@ class UnitedStates:
                 self.month = 1
                 self.year += 1
 
+            reports.append(self._turn_report)
+        self._turn_report = None
+        return reports
+
     # --- factory ---
     @staticmethod
     def new_default(seed: Optional[int] = None) -> "UnitedStates":
@@ -1771,6 +2060,7 @@ class UnitedStates:
             opinion=opinion,
             event_manager=em,
             rng=rng,
+            shock_rng=np.random.default_rng(seed),
         )
 
     # --- structured snapshot ---
@@ -1820,9 +2110,59 @@ class UnitedStates:
             "parties": {
                 pid.value: p.national_approval for pid, p in self.parties.items()
             },
-            "log_tail": self.log[-last_logs:],
+            "log_tail": self.tail_log(last_logs),
         }
 
+    def snapshot_lines(self, last_logs: int = 20) -> Iterator[str]:
+        """Yield `snapshot()` formatted as human-readable lines.
+
+        The lines are built from the snapshot dict itself, so the text form
+        and the structured form always carry the same fields.
+        """
+        snap = self.snapshot(last_logs)
+        macro = snap["macro"]
+        federal = snap["federal"]
+        budget = federal["budget"]
+        opinion = federal["opinion"]
+        yield f"Date: {snap['time']['year']}-{snap['time']['month']:02d}"
+        yield (
+            f"Macro: growth {macro['growth']:.4f} | unemployment "
+            f"{macro['unemployment']:.2f}% | inflation {macro['inflation']:.2f}%"
+        )
+        yield (
+            f"Federal: president {federal['president_party']} | house "
+            f"{federal['house_control']} | senate "
+            f"{federal['senate_control']} | court {federal['court_lean']}"
+        )
+        yield (
+            f"Budget: revenue {budget['revenue']:.1f}B | spending "
+            f"{budget['spending']:.1f}B | deficit {budget['deficit']:.1f}B"
+        )
+        yield (
+            f"Opinion: president {opinion['president']:.1f}% | "
+            f"congress {opinion['congress']:.1f}%"
+        )
+        yield "States:"
+        for name, st in snap["states"].items():
+            yield (
+                f"  {name}: pop {st['population']} | gdp {st['gdp']:.1f}B | "
+                f"unemp {st['unemployment']:.2f}% | infl "
+                f"{st['inflation']:.2f}% | rev {st['rev']:.1f}B"
+                f" | spend {st['spend']:.1f}B | tax "
+                f"{st['tax_rate']:.3f} | gov {st['governor_party']} | "
+                f"leg {st['leg_house']}/{st['leg_senate']}"
+            )
+        yield "Parties:"
+        for party, approval in snap["parties"].items():
+            yield f"  {party}: approval {approval:.1f}%"
+        yield "Log:"
+        for entry in snap["log_tail"]:
+            yield f"  {entry}"
+
+    def write_snapshot(self, fh: IO[str], last_logs: int = 20) -> None:
+        """Write `snapshot_lines()` to a text stream, one line at a time."""
+        fh.writelines(f"{line}\n" for line in self.snapshot_lines(last_logs))
+
     # --- serialization ---
     def to_dict(self) -> Dict[str, object]:
         return {
@@ -1843,6 +2183,7 @@ class UnitedStates:
             "states": {name: st.to_dict() for name, st in self.states.items()},
             "events": self.event_manager.to_dict(),
             "rng_state": _listify(self.rng.getstate()),
+            "shock_rng_state": self.shock_rng.bit_generator.state,
             "log": list(self.log),
             "recent_events": list(self.recent_events),
         }
@@ -1855,6 +2196,18 @@ class UnitedStates:
         rng_state = data.get("rng_state")
         if rng_state is not None:
             rng.setstate(_tupleify(rng_state))
+        shock_state = data.get("shock_rng_state")
+        if shock_state is not None:
+            name = shock_state.get("bit_generator")
+            if name not in _SHOCK_BIT_GENERATORS:
+                raise ValueError(f"unsupported shock RNG bit generator: {name!r}")
+            bit_generator = _SHOCK_BIT_GENERATORS[name]()
+            bit_generator.state = shock_state
+            shock_rng = np.random.Generator(bit_generator)
+        else:
+            # older saves: derive a fixed seed from the restored `rng` state
+            # without consuming any of its draws
+            shock_rng = np.random.default_rng(list(rng.getstate()[1]))
         parties = {
             PartyID(k): PoliticalParty.from_dict(v)
             for k, v in data.get("parties", {}).items()
@@ -1873,6 +2226,7 @@ class UnitedStates:
             opinion=PublicOpinion.from_dict(data["federal"]["opinion"]),  # type: ignore[index]
             event_manager=em,
             rng=rng,
+            shock_rng=shock_rng,
             growth=float(data["macro"]["growth"]),  # type: ignore[index]
             unemployment=float(data["macro"]["unemployment"]),  # type: ignore[index]
             inflation=float(data["macro"]["inflation"]),  # type: ignore[index]